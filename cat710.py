@@ -1,6 +1,6 @@
-import io
-import re
 import sys
+import time
+from functools import lru_cache, partial
 from common710 import *
 from queue import Queue
 
@@ -13,6 +13,230 @@ __maintainer__ = "Steve Magnuson"
 __email__ = "ag7gn@arrl.net"
 __status__ = "Production"
 
+# Side letter ('A'/'B') -> CAT side argument ('0'/'1') used by run_job
+_SIDE_INV = SIDE_DICT['inv']
+# CAT side argument ('0'/'1') -> side letter ('A'/'B')
+_SIDE_MAP = SIDE_DICT['map']
+# Mode name ('VFO', 'MR', 'CALL', 'WX') -> CAT VM mode argument
+_MODE_INV = MODE_DICT['inv']
+# Commands update_dictionary sends to read the state of a side in each
+# mode. Call and WX modes also use FO rather than CC data.
+_MODE_QUERIES = {'MR': ('MR', 'FO'), 'VFO': ('FO',), 'CALL': ('FO',),
+                 'WX': ('FO',)}
+# (FO/ME field index, tone type) of the Tone, CTCSS and DCS status fields
+_TONE_TYPE_POSITIONS = tuple((int(k), k) for k in TONE_TYPE_DICT['map']
+                             if k != '0')
+# FO/ME field index of the on/off flag of each tone type
+_TONE_TYPE_INDEX = {key: pos for pos, key in _TONE_TYPE_POSITIONS}
+# FO/ME field index of the frequency of each tone type, always 3 fields
+# up from its on/off flag
+_TONE_FREQUENCY_INDEX = {key: pos + 3 for pos, key in _TONE_TYPE_POSITIONS}
+# MU field index set directly from the job value by run_job
+_MENU_SETTERS = {k: MENU_DICT[k]['index'] for k in ('data', 'speed',
+                                                    'timeout')}
+# MU field index of the ON/OFF settings run_job toggles
+_MENU_TOGGLES = {k: MENU_DICT[k]['index'] for k in ('vhf_aip', 'uhf_aip')}
+# MU field index and values of the backlight color run_job toggles
+_BACKLIGHT_MENU = MENU_DICT['backlight']
+# CTRL and PTT indicators on the A and B sides for each BC side value
+_CTRL_FLAGS = {'0': ('CTRL', '   '), '1': ('   ', 'CTRL')}
+_PTT_FLAGS = {'0': ('PTT', '   '), '1': ('   ', 'PTT')}
+# Microphone key command sent for each up/down job
+_KEY_COMMANDS = {'up': 'UP', 'down': 'DW', 'micup': 'UP', 'micdown': 'DW'}
+# Opposite of a '0'/'1' CAT flag
+_TOGGLE = {'0': '1', '1': '0'}
+# Sign of the offset for each SHIFT_DICT key. Simplex ('0') has none.
+_SHIFT_SIGN = {'1': 1, '2': -1}
+# Sign of the offset added to the frequency when toggling reverse, keyed
+# by (current reverse flag, SHIFT_DICT key): + going to reverse with
+# shift +, - coming back from it. Simplex frequencies don't move.
+_REV_SIGN = {**{('0', k): v for k, v in _SHIFT_SIGN.items()},
+             **{('1', k): -v for k, v in _SHIFT_SIGN.items()}}
+# Lowest and highest VFO frequency of each side in Hz
+_FREQUENCY_LIMITS_HZ = {k: (int(float(v['min']) * 1000000),
+                            int(float(v['max']) * 1000000))
+                        for k, v in FREQUENCY_LIMITS.items()}
+# Step size in Hz of each STEP_DICT key
+_STEP_HZ = {k: round(float(v) * 1000) for k, v in STEP_DICT['map'].items()}
+
+
+@lru_cache(maxsize=64)
+def _display_frequency(field: str) -> str:
+    """
+    Converts the frequency field of an FO/ME reply to the displayed
+    frequency. Each refresh reads the same few frequencies, so the
+    conversions are cached.
+    :param field: String containing the 10 digit frequency in Hz
+    :return: String containing the frequency in MHz to 3 decimal places
+    """
+    return f"{int(field) / 1000000:.3f}"
+
+
+def _apply_common_elements(side_state: dict, result: list, mode_str: str):
+    """
+    Saves the fields of an FO/ME reply that every mode displays to the
+    state dictionary of one side of the radio
+    :param side_state: State dictionary of the side, 'A' or 'B'
+    :param result: List containing the FO reply for the side
+    :param mode_str: Mode of the side: 'MR', 'VFO', 'CALL' or 'WX'
+    """
+    smap = STATE_DICT['map']
+    if smap[result[6]] == "ON":
+        # Tone is set
+        t = "Tone"
+        tf = TONE_FREQUENCY_DICT[t]['map'][result[9]]
+    elif smap[result[7]] == "ON":
+        # CTCSS is set
+        t = "CTCSS"
+        tf = TONE_FREQUENCY_DICT[t]['map'][result[10]]
+    elif smap[result[8]] == "ON":
+        # DCS is set
+        t = "DCS"
+        tf = TONE_FREQUENCY_DICT[t]['map'][result[11]]
+    else:
+        t = "No Tone"
+        tf = TONE_FREQUENCY_DICT[t]
+    # Save tone to state dictionary
+    side_state['tone'] = t
+    side_state['tone_frequency'] = tf
+    # Save shift to state dictionary
+    side_state['shift'] = SHIFT_DICT['map'][result[4]]
+    # Save reverse status to state dictionary
+    side_state['reverse'] = REVERSE_DICT['map'][result[5]]
+    # Save modulation to state dictionary
+    side_state['modulation'] = MODULATION_DICT['map'][result[13]]
+    # Save the mode to the state dictionary
+    side_state['mode'] = mode_str
+    # Save the RX step to state dictionary
+    side_state['step'] = STEP_DICT['map'][result[3]]
+    # Save the frequency to the state dictionary
+    side_state['frequency'] = _display_frequency(result[2])
+
+
+def _current_tone_type(fields: list) -> str:
+    """
+    Finds the tone type that is on in an FO/ME reply
+    :param fields: List containing the FO or ME reply
+    :return: TONE_TYPE_DICT key of the tone type, '0' (No Tone) if no
+             tone type is on
+    """
+    return next((key for pos, key in _TONE_TYPE_POSITIONS
+                 if fields[pos] == '1'), '0')
+
+
+def _emit(msg_queue: Queue, level: str, text: str):
+    """
+    Sends a time stamped status message to the message console
+    :param msg_queue: Queue to which to send the message
+    :param level: 'INFO', 'WARNING' or 'ERROR'
+    :param text: String containing the message
+    """
+    msg_queue.put([level, f"{stamp()}: {text}"])
+
+
+def _cat_command(fields: list) -> str:
+    """
+    Builds a CAT command string from a reply list whose fields have
+    been edited, the inverse of Cat._parse_answer
+    :param fields: List containing the 2 character command followed by
+                   its arguments
+    :return: String containing the command, a space and the comma
+             separated arguments
+    """
+    return ','.join(fields).replace(',', ' ', 1)
+
+
+def _edit_tone(arg_list: list, job: list) -> bool:
+    """
+    Changes the tone type in an FO/ME reply
+    :param arg_list: List containing the FO or ME reply to edit
+    :param job: 'tone' job. job[2] is the TONE_TYPE_DICT key.
+    :return: False if the tone type is already the requested one
+    """
+    if _current_tone_type(arg_list) == job[2]:
+        # Requested tone type is the same as current
+        return False
+    # Set all tones (tone freq., CTCSS freq., DCS freq.) to off for now...
+    for pos, _ in _TONE_TYPE_POSITIONS:
+        arg_list[pos] = '0'
+    if job[2] != '0':
+        # Change to requested tone type
+        arg_list[_TONE_TYPE_INDEX[job[2]]] = '1'
+    return True
+
+
+def _edit_tone_frequency(arg_list: list, job: list) -> bool:
+    """
+    Sets the tone frequency of the current tone type in an FO/ME reply
+    :param arg_list: List containing the FO or ME reply to edit
+    :param job: 'tone_frequency' job. job[2] is the tone frequency.
+    :return: False if there is no tone or the frequency is already set
+    """
+    current_type = _current_tone_type(arg_list)
+    if current_type == '0':
+        # No Tone has no tone frequency
+        return False
+    tone_frequency = TONE_FREQUENCY_DICT[current_type]['inv'][job[2]]
+    index = _TONE_FREQUENCY_INDEX[current_type]
+    if arg_list[index] == tone_frequency:
+        # Requested tone frequency is the same as current
+        return False
+    arg_list[index] = tone_frequency
+    return True
+
+
+def _edit_frequency(arg_list: list, job: list) -> bool:
+    """
+    Sets the frequency, and the standard shift and offset for it, in an
+    FO/ME reply
+    :param arg_list: List containing the FO or ME reply to edit
+    :param job: 'frequency' job. job[2] is the frequency in MHz.
+    :return: True
+    """
+    freq_hz = int(job[2] * 1000000)
+    arg_list[2] = str(freq_hz).zfill(10)
+    arg_list[4], arg_list[12] = frequency_shifts(freq_hz)
+    return True
+
+
+def _edit_rev(arg_list: list, job: list) -> bool:
+    """
+    Toggles reverse in an FO/ME reply
+    :param arg_list: List containing the FO or ME reply to edit
+    :param job: 'rev' job
+    :return: True
+    """
+    sign = _REV_SIGN.get((arg_list[5], arg_list[4]))
+    # Change *TO* or *FROM* REV state
+    arg_list[5] = '1' if arg_list[5] == '0' else '0'
+    if sign is not None:
+        # Shift (or unshift) the frequency by the offset
+        _freq = int(arg_list[2]) + sign * int(arg_list[12])
+        arg_list[2] = str(_freq).zfill(10)
+    return True
+
+
+def _edit_field(index: int, arg_list: list, job: list) -> bool:
+    """
+    Sets one FO/ME field to the job value
+    :param index: Index of the field in the FO/ME reply
+    :param arg_list: List containing the FO or ME reply to edit
+    :param job: Job whose job[2] is the new field value
+    :return: True
+    """
+    arg_list[index] = job[2]
+    return True
+
+
+# Function that applies each FO/ME editing job to the channel data
+_ARG_LIST_EDITS = {'tone': _edit_tone,
+                   'tone_frequency': _edit_tone_frequency,
+                   'frequency': _edit_frequency,
+                   'rev': _edit_rev,
+                   'modulation': partial(_edit_field, 13),
+                   'step': partial(_edit_field, 3),
+                   'shift': partial(_edit_field, 4)}
+
 
 # noinspection PyTypeChecker
 class Cat(object):
@@ -23,11 +247,17 @@ class Cat(object):
     control the radio via a serial interface. The Kenwood CAT commands
     are documented at https://github.com/LA3QMA/TM-V71_TM-D710-Kenwood
     """
+    _BC_TTL = 0.05  # Seconds a BC reply is reused for
+    _MAX_BATCH = 8  # Most CAT commands query_batch writes at once
+    _VFO_TTL = 2.0  # Seconds a VFO frequency read in Memory mode is reused
+    _REFRESH_TTL = 1.0  # Seconds an MU or LK reply from a refresh is reused
+    _FRAME_TTL = 0.25  # Seconds FO/ME/CC channel data is reused
+
     def __init__(self, serial_port: object, **kwargs):
         """
-        Initializes a BufferedRWPair object that wraps a serial object.
-        Wrapping the serial port object allows customization of the
-        end-of-line character used by the radio
+        Initializes the radio state dictionary. CAT commands are written
+        to and replies read from the serial object as ASCII bytes
+        terminated with '\r'.
         :param serial_port: Serial object
         """
         if kwargs['job_queue']:
@@ -36,9 +266,7 @@ class Cat(object):
             self.job_queue = None
         self.gui = None
         self.ser = serial_port
-        sio = io.TextIOWrapper(io.BufferedRWPair(self.ser, self.ser),
-                               newline='\r')
-        self.sio = sio
+        self._rx_buf = bytearray()
         self.state = {'A': {'mode': None, 'ch_name': None,
                             'ch_number': None, 'frequency': None,
                             'shift': None, 'reverse': None,
@@ -68,7 +296,55 @@ class Cat(object):
                                'serial': ''
                                }
                       }
-        self.reply_queue = Queue()
+        # State dictionary of each side, keyed by CAT side argument
+        self._sides = {'0': self.state['A'], '1': self.state['B']}
+        # Memory channel name replies, keyed by unformatted channel
+        # number. Names only change when a command job writes them, and
+        # the radio has at most 1000 channels, so this never needs
+        # trimming.
+        self._mn_cache = {}
+        # Last BC reply and the time.monotonic() time it was received
+        self._bc_cache = None
+        self._bc_cache_ts = 0.0
+        # VFO frequency in Hz of each side ('0'/'1') read while the side
+        # was in Memory mode, and the time.monotonic() time it was read
+        self._vfo_cache = {}
+        # Last FO, ME or CC channel data read by a refresh or written by
+        # a job for each side ('0'/'1'), as (time.monotonic() time, list)
+        self._frames = {}
+        # MU and LK replies saved by update_dictionary, keyed by command,
+        # as (time.monotonic() time received, reply)
+        self._refresh_cache = {}
+        # First and second batch replies of the last refresh that was
+        # decoded into self.state, None when the state must be decoded
+        # again at the next refresh
+        self._last_replies = None
+        # (type, args) of the last serial port error reported, None
+        # after a good exchange
+        self._last_serial_error = None
+        # Method that runs each type of job in run_job()
+        self._job_handlers = {'mode': self._job_mode,
+                              'ptt': self._job_bc,
+                              'ctrl': self._job_bc,
+                              'power': self._job_power,
+                              'lock': self._job_lock,
+                              'beep': self._job_menu,
+                              'vhf_aip': self._job_menu,
+                              'uhf_aip': self._job_menu,
+                              'speed': self._job_menu,
+                              'backlight': self._job_menu,
+                              'apo': self._job_menu,
+                              'data': self._job_menu,
+                              'timeout': self._job_menu,
+                              'up': self._job_step,
+                              'down': self._job_step,
+                              'ch_number': self._job_ch_number,
+                              'micup': self._job_mic,
+                              'micdown': self._job_mic,
+                              'cat_ptt': self._job_cat_ptt,
+                              'command': self._job_command}
+        self._job_handlers.update(
+            dict.fromkeys(_ARG_LIST_EDITS, self._job_edit))
 
     @property
     def gui_root(self) -> object:
@@ -82,9 +358,9 @@ class Cat(object):
     def gui_root(self, root: object):
         self.gui = root
 
-    def query(self, request: str) -> tuple:
+    def query(self, request: str) -> list:
         """
-        Sends CAT command to Kenwood radio and returns reply as a tuple.
+        Sends CAT command to Kenwood radio and returns reply as a list.
         Kenwood CAT commands for the TM-D710G and TM-V71A begin with a
         2 alpha character string (the command) optionally followed by
         one or more arguments, followed by a carriage return '\r'.
@@ -94,14 +370,106 @@ class Cat(object):
         See https://github.com/LA3QMA/TM-V71_TM-D710-Kenwood for
         details.
         :param: request: String containing CAT command to send to radio
-        :return: Tuple containing radio's reply to the command. Returns
-                empty tuple if radio returns '?' (indicating an unknown
-                command) or if there's a problem communicating with the
-                radio. Otherwise, it returns the original 2 character
-                command followed by a comma separated containing the
-                radio's reply.
+        :return: List containing radio's reply to the command. Returns
+                empty list if radio returns '?' (indicating an unknown
+                command) or doesn't answer, or None if there's a problem
+                communicating with the radio. Otherwise, it returns the
+                original 2 character command followed by a comma
+                separated containing the radio's reply.
+        """
+
+        try:
+            self.ser.write(self._cat_bytes(request))
+            answer = self._read_answer()
+        except Exception as error:
+            self._serial_error(error)
+            return None
+        self._last_serial_error = None
+        return self._parse_answer(answer)
+
+    def query_batch(self, requests: list) -> list:
+        """
+        Sends several CAT commands to the radio in a single write, then
+        reads back one reply per command. The radio answers commands in
+        the order it receives them, so this saves waiting for each reply
+        before sending the next command. At most _MAX_BATCH commands are
+        written before their replies are read, so the radio's input
+        buffer can't overflow.
+        :param: requests: List of strings containing CAT commands
+        :return: List containing a list for each reply, in the same
+                 order as requests, or None if there's a problem
+                 communicating with the radio. See query() for the list
+                 format.
+        """
+        answers = []
+        try:
+            for i in range(0, len(requests), self._MAX_BATCH):
+                batch = requests[i:i + self._MAX_BATCH]
+                self.ser.write(b''.join(self._cat_bytes(r) for r in batch))
+                answers.extend(self._read_answer() for _ in batch)
+        except Exception as error:
+            self._serial_error(error)
+            return None
+        self._last_serial_error = None
+        return [self._parse_answer(answer) for answer in answers]
+
+    def _serial_error(self, error: Exception):
+        """
+        Reports a serial port error to stderr. An error identical to the
+        previous one is not reported again until a command succeeds, so
+        a disconnected radio doesn't flood stderr on every refresh.
+        :param error: Exception raised by the serial port
         """
+        # Compare the exception's type and arguments, so a repeated
+        # error isn't formatted at all
+        key = (type(error), error.args)
+        if key != self._last_serial_error:
+            self._last_serial_error = key
+            print(f"{stamp()}: No response from radio: "
+                  f"Serial Port ERROR: {error}", file=sys.stderr)
 
+    def _read_answer(self) -> str:
+        """
+        Reads one reply from the radio, taking whatever the port has
+        waiting in one read and keeping any bytes past the \r for the
+        next reply
+        :return: String containing the reply including the trailing
+                 \r, or whatever arrived before the serial port timed out
+        """
+        buf = self._rx_buf
+        start = 0
+        while True:
+            end = buf.find(b'\r', start)
+            if end >= 0:
+                line = bytes(buf[:end + 1])
+                del buf[:end + 1]
+                break
+            start = len(buf)
+            data = self.ser.read(max(1, min(2048, self.ser.in_waiting)))
+            if not data:
+                # Timed out
+                line = bytes(buf)
+                buf.clear()
+                break
+            buf += data
+        return line.decode('ascii', errors='replace')
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _cat_bytes(request: str) -> bytes:
+        """
+        Formats a request as a CAT command to write to the serial port.
+        The update_dictionary queries repeat every refresh, so their
+        encoded form is cached.
+        :param request: String containing CAT command
+        :return: Bytes containing the command, a single space and the
+                 arguments if present, followed by \r for EOL
+        """
+        if request and request.isprintable() and \
+                ' ' not in (request[0], request[-1]) and \
+                '  ' not in request:
+            # Already a single spaced command, as run_job builds them
+            return f"{request}\r".encode('ascii')
         # Split the request string on whitespace
         request_list = request.split(maxsplit=1)
         command = request_list[0]  # 2 character Kenwood command
@@ -111,36 +479,71 @@ class Cat(object):
             send_string = command
         # Remove any leading/trailing whitespace from send_string and
         # append \r for EOL
-        try:
-            self.sio.write(f"{send_string.strip()}\r")
-            self.sio.flush()  # io object buffers, so force data out
-            # Replace space separating 2 character command and answer
-            # with a ',' so we can include it in the returned tuple
-            answer = re.sub(' ', ',', self.sio.readline())
-        except Exception as error:
-            raise QueryException(f"Serial Port ERROR: {error}")
+        return f"{send_string.strip()}\r".encode('ascii')
+
+    @staticmethod
+    def _parse_answer(answer: str) -> list:
+        """
+        Converts a line read from the radio to a list
+        :param answer: String containing the radio's reply
+        :return: List containing the reply. Empty list if there was
+                 no reply.
+        """
+        # Replace space separating 2 character command and answer
+        # with a ',' so we can include it in the returned list
+        answer = answer.replace(' ', ',', 1)
         # if answer and answer != '?':
         if answer:
-            # Remove trailing \r and convert string to tuple
-            return tuple(answer[:-1].split(','))
+            # Remove trailing \r and convert string to list
+            return answer[:-1].split(',')
         else:
-            return ()
+            return []
 
-    def handle_query(self, cmd: str) -> list:
+    def _get_ptt_ctrl(self) -> tuple:
         """
-        Wrapper for the query method.
-        :param: cmd: String to pass to query method
-        :return: List containing the output of the radio command, or
-                 None if the command failed.
+        Retrieves current PTT and CTRL state of radio. A BC reply
+        received in the last _BC_TTL seconds is reused rather than
+        asking the radio again.
+        :return: Tuple (CTRL_state, PTT_state) where CTRL_state and
+        PTT_state are 0 or 1. Returns empty tuple if unable to
+        retrieve data
         """
-        try:
-            result = self.query(cmd)
-        except QueryException as error:
-            print(f"{stamp()}: No response from radio: {error}",
-                  file=sys.stderr)
-            return []
-        else:
-            return result
+        if self._bc_cache is None or \
+                time.monotonic() - self._bc_cache_ts >= self._BC_TTL:
+            _answer = self.query("BC")
+            if not _answer:
+                return ()
+            self._cache_bc(_answer)
+        return self._bc_cache[1], self._bc_cache[2]
+
+    def _cache_bc(self, answer: list):
+        """
+        Saves a BC reply for _get_ptt_ctrl
+        :param answer: List containing the BC reply, or None to
+                       discard the saved reply after the PTT or CTRL
+                       side may have changed
+        """
+        self._bc_cache = answer
+        self._bc_cache_ts = time.monotonic()
+
+    def _query_refreshed(self, request: str) -> list:
+        """
+        Queries the radio unless update_dictionary received the reply
+        in the last _REFRESH_TTL seconds. The saved reply is handed over
+        rather than copied, because the caller is about to change the
+        setting it holds.
+        :param request: CAT query saved by update_dictionary, 'MU' or 'LK'
+        :return: List containing the reply, or None if there was no
+        reply
+        """
+        cached = self._refresh_cache.pop(request, None)
+        if cached is not None and \
+                time.monotonic() - cached[0] < self._REFRESH_TTL:
+            # The reply is also part of the last refresh's replies, so
+            # those can no longer be compared against
+            self._last_replies = None
+            return cached[1]
+        return self.query(request)
 
     def ask(self, ask_type: str, ask_msg: str):
         """
@@ -182,13 +585,13 @@ class Cat(object):
         return self.state['info']
 
     @info.setter
-    def info(self, answer: tuple):
+    def info(self, answer: list):
         """
         Populate model, serial, and firmware versions in state dictionary
-        :param answer: string containing CAT command result from radio
+        :param answer: list containing CAT command result from radio
         """
         if answer[0] == 'AE':
-            self.state['info']['serial'] = answer[1].split(',')[0]
+            self.state['info']['serial'] = answer[1]
         elif answer[0] == 'ID':
             self.state['info']['model'] = answer[1]
         elif answer[0] == 'FV':
@@ -204,191 +607,103 @@ class Cat(object):
         Queries the radio for several parameters that are used to
         populate a state dictionary, which maps values to the onscreen
         display. Several commands are needed to obtain all the required
-        information.
+        information. A reply that is missing fields raises IndexError,
+        which the controller reports as a communication error.
         :return: dictionary with the screen parameters. The dictionary
         is defined and initialized in __init__() method.
         """
 
-        def common_elements(_mode_str: str):
-            try:
-                if STATE_DICT['map'][result[6]] == "ON":
-                    # Tone is set
-                    t = "Tone"
-                    tf = TONE_FREQUENCY_DICT[t]['map'][result[9]]
-                elif STATE_DICT['map'][result[7]] == "ON":
-                    # CTCSS is set
-                    t = "CTCSS"
-                    tf = TONE_FREQUENCY_DICT[t]['map'][result[10]]
-                elif STATE_DICT['map'][result[8]] == "ON":
-                    # DCS is set
-                    t = "DCS"
-                    tf = TONE_FREQUENCY_DICT[t]['map'][result[11]]
-                else:
-                    t = "No Tone"
-                    tf = TONE_FREQUENCY_DICT[t]
-                # Save tone to state dictionary
-                self.state[SIDE_DICT['map'][s]]['tone'] = t
-                self.state[SIDE_DICT['map'][s]]['tone_frequency'] = tf
-                # Save shift to state dictionary
-                self.state[SIDE_DICT['map'][s]]['shift'] = \
-                    SHIFT_DICT['map'][result[4]]
-                # Save reverse status to state dictionary
-                self.state[SIDE_DICT['map'][s]]['reverse'] = \
-                    '{}'.format(REVERSE_DICT['map'][result[5]])
-                # Save modulation to state dictionary
-                self.state[SIDE_DICT['map'][s]]['modulation'] = \
-                    '{}'.format(MODULATION_DICT['map'][result[13]])
-                # Save the mode to the state dictionary
-                self.state[SIDE_DICT['map'][s]]['mode'] = _mode_str
-                # Save the RX step to state dictionary
-                self.state[SIDE_DICT['map'][s]]['step'] = \
-                    STEP_DICT['map'][result[3]]
-                # Save the frequency to the state dictionary
-                self.state[SIDE_DICT['map'][s]]['frequency'] = \
-                    "{:.3f}".format(int(result[2]) / 1000000)
-            except IndexError as _:
-                raise
-
-        result = []
-        result = self.handle_query(f"BC")
-        if not result:
+        sides = ('0', '1')  # '0' = A side, '1' = B side
+        state_a = self._sides['0']
+        state_b = self._sides['1']
+        # The first batch doesn't depend on the mode of either side
+        first = self.query_batch(["BC", "VM 0", "VM 1", "PC 0", "PC 1",
+                                  "MU", "LK"])
+        if not first or not all(first):
             return {}
-        try:
-            self.state['A']['ctrl'] = 'CTRL' if result[1] == '0' else '   '
-            self.state['B']['ctrl'] = 'CTRL' if result[1] == '1' else '   '
-            self.state['A']['ptt'] = 'PTT' if result[2] == '0' else '   '
-            self.state['B']['ptt'] = 'PTT' if result[2] == '1' else '   '
-            sides = ('0', '1')
-        except IndexError as _:
-            raise
-        for s in sides:  # '0' = A side, '1' = B side
-            # Determine current mode (VFO, Memory, Call)
-            result = self.handle_query(f"VM {s}")
-            if not result:
+        bc, vm_a, vm_b, pc_a, pc_b, mu, lk = first
+        self._cache_bc(bc)
+        now = time.monotonic()
+        self._refresh_cache['MU'] = (now, mu)
+        self._refresh_cache['LK'] = (now, lk)
+        # Determine current mode (VFO, Memory, Call) of each side
+        modes = {'0': MODE_DICT['map'][vm_a[2]],
+                 '1': MODE_DICT['map'][vm_b[2]]}
+        # The second batch retrieves the memory channel of sides in
+        # Memory mode and the FO data of each side
+        requests = [f"{cmd} {s}" for s in sides
+                    for cmd in _MODE_QUERIES.get(modes[s], ())]
+        second = []
+        if requests:
+            second = self.query_batch(requests)
+            if not second or not all(second):
                 return {}
-            if MODE_DICT['map'][result[2]] == 'MR':
+        replies = iter(second)
+        side_replies = {}  # (MR reply or None, FO reply) of each side
+        for s in sides:
+            if modes[s] not in _MODE_QUERIES:
+                continue
+            mr = next(replies) if modes[s] == 'MR' else None
+            side_replies[s] = (mr, next(replies))
+            if modes[s] == 'VFO':
+                # The FO reply is the channel data VFO jobs start from
+                self._frames[s] = (now, side_replies[s][1])
+        if (first, second) == self._last_replies:
+            # Nothing the display shows has changed since the last refresh
+            return self.state
+        result = bc
+        state_a['ctrl'], state_b['ctrl'] = \
+            _CTRL_FLAGS.get(result[1], ('   ', '   '))
+        state_a['ptt'], state_b['ptt'] = \
+            _PTT_FLAGS.get(result[2], ('   ', '   '))
+        # Power
+        power_map = POWER_DICT['map']
+        for side_state, result in zip((state_a, state_b), (pc_a, pc_b)):
+            side_state['power'] = power_map[result[2]]
+        ch_nums_raw = {}  # Unformatted channel numbers
+        for s, (mr, result) in side_replies.items():
+            side_state = self._sides[s]
+            if mr is not None:
                 # This side is in Memory mode
-                # Retrieve memory channel
-                result = self.handle_query(f"MR {s}")
-                if not result:
-                    return {}
-                ch_num_raw = result[2]  # Unformatted channel number
-                try:
-                    # Save the channel number to the state dictionary
-                    self.state[SIDE_DICT['map'][s]]['ch_number'] = \
-                        int(result[2])
-                except IndexError as _:
-                    raise
-                # Retrieve state information for this memory channel
-                result = self.handle_query(f"FO {s}")
-                if not result:
-                    return {}
-                # print(f"{stamp()}: {result}", file=sys.stderr)
-                try:
-                    common_elements('MR')
-                except IndexError as _:
-                    raise
-                # Retrieve the channel name
-                result = self.handle_query(f"MN {ch_num_raw}")
-                if not result:
-                    return {}
-                try:
-                    if result[0] != 'N':
-                        self.state[SIDE_DICT['map'][s]]['ch_name'] = \
-                            result[2]
-                except IndexError as _:
-                    raise
-            # else:
-            #     print(f"{stamp()}: ERROR: Nothing in memory",
-            #           file=sys.stderr)
-            elif MODE_DICT['map'][result[2]] == 'VFO':
-                # This side is in VFO mode. Retrieve FO data
-                result = self.handle_query(f"FO {s}")
-                if not result:
-                    return {}
-                try:
-                    common_elements('VFO')
-                except IndexError as _:
-                    raise
-                try:
-                    self.state[SIDE_DICT['map'][s]]['ch_number'] = '  '
-                    self.state[SIDE_DICT['map'][s]]['ch_name'] = '      '
-                except IndexError as _:
-                    raise
-            elif MODE_DICT['map'][result[2]] == 'CALL':
-                # This side is in Call mode. Retrieve CC data
-                # result = self.handle_query(f"CC {s}")
-                result = self.handle_query(f"FO {s}")
-                if not result:
-                    return {}
-                try:
-                    common_elements('CALL')
-                except IndexError as _:
-                    raise
-                try:
-                    self.state[SIDE_DICT['map'][s]]['ch_number'] = '  '
-                    self.state[SIDE_DICT['map'][s]]['ch_name'] = '      '
-                except IndexError as _:
-                    raise
-            elif MODE_DICT['map'][result[2]] == 'WX':
-                # This side is in Call mode. Retrieve CC data
-                # result = self.handle_query(f"CC {s}")
-                result = self.handle_query(f"FO {s}")
-                if not result:
-                    return {}
-                try:
-                    common_elements('WX')
-                except IndexError as _:
-                    raise
-                try:
-                    self.state[SIDE_DICT['map'][s]]['ch_number'] = '  '
-                    self.state[SIDE_DICT['map'][s]]['ch_name'] = '      '
-                except IndexError as _:
-                    raise
+                ch_nums_raw[s] = mr[2]
+                # Save the channel number to the state dictionary
+                side_state['ch_number'] = int(mr[2])
             else:
-                pass
-            # Power
-            result = self.handle_query(f"PC {s}")
-            if not result:
+                side_state['ch_number'] = '  '
+                side_state['ch_name'] = '      '
+            # State information for this side
+            _apply_common_elements(side_state, result, modes[s])
+        # The third batch retrieves the channel names not already in the
+        # cache, which need the channel numbers from the second batch
+        uncached = [ch for ch in set(ch_nums_raw.values())
+                    if ch not in self._mn_cache]
+        if uncached:
+            replies = self.query_batch(
+                [f"MN {ch}" for ch in uncached])
+            if not replies or not all(replies):
                 return {}
-            try:
-                self.state[SIDE_DICT['map'][s]]['power'] = POWER_DICT['map'][result[2]]
-            except IndexError as _:
-                raise
+            self._mn_cache.update(zip(uncached, replies))
+        for s, ch in ch_nums_raw.items():
+            result = self._mn_cache[ch]
+            if result[0] != 'N':
+                self._sides[s]['ch_name'] = result[2]
         # Data side
-        result = self.handle_query(f"MU")
-        if not result:
-            return {}
-        try:
-            if result[38] in ['0', '1']:
-                self.state['data_side'] = SIDE_DICT['map'][result[38]]
-            else:
-                self.state['data_side'] = None
-            self.state[SIDE_DICT['map']['0']]['data'] = \
-                'D' if result[38] == '0' else \
-                'D-TX' if result[38] == '2' else \
-                'D-RX' if result[38] == '3' else \
-                ' '
-            self.state[SIDE_DICT['map']['1']]['data'] = \
-                'D' if result[38] == '1' else \
-                'D-RX' if result[38] == '2' else \
-                'D-TX' if result[38] == '3' else \
-                ' '
-            self.state['speed'] = DATA_SPEED_DICT['map'][result[39]]
-            self.state['timeout'] = TIMEOUT_DICT['map'][result[16]]
-            self.state['vhf_aip'] = STATE_DICT['map'][result[11]]
-            self.state['uhf_aip'] = STATE_DICT['map'][result[12]]
-            self.state['backlight'] = BACKLIGHT_DICT['map'][result[28]]
-        except IndexError as _:
-            raise
+        result = mu
+        if result[38] in ['0', '1']:
+            self.state['data_side'] = _SIDE_MAP[result[38]]
+        else:
+            self.state['data_side'] = None
+        state_a['data'], state_b['data'] = \
+            DATA_SIDE_MAP.get(result[38], (' ', ' '))
+        self.state['speed'] = DATA_SPEED_DICT['map'][result[39]]
+        self.state['timeout'] = TIMEOUT_DICT['map'][result[16]]
+        self.state['vhf_aip'] = STATE_DICT['map'][result[11]]
+        self.state['uhf_aip'] = STATE_DICT['map'][result[12]]
+        self.state['backlight'] = BACKLIGHT_DICT['map'][result[28]]
         # Lock state
-        result = self.handle_query(f"LK")
-        if not result:
-            return {}
-        try:
-            self.state['lock'] = LOCK_DICT['map'][result[1]]
-        except IndexError as _:
-            raise
+        result = lk
+        self.state['lock'] = LOCK_DICT['map'][result[1]]
+        self._last_replies = (first, second)
         return self.state
 
     def get_dictionary(self) -> dict:
@@ -402,365 +717,412 @@ class Cat(object):
         """
         Accepts a job list and constructs the corresponding Kenwood
         CAT command string needed to fulfill the job task. Sends CAT
-        command string to handle_query.
+        command string to query.
         :param job: list containing job
         :param msg_queue: Queue to which to send status messages
-        :return: The job that was sent as an argument, or if the job
-        was a 'command', the result of the command will be the second
-        list element. Returns empty list if the job could not be
-        completed.
-        """
-
-        def get_arg_list() -> list:
-            """
-            Creates a CAT command argument list because some CAT
-            commands require interim CAT queries to construct
-            the user's query.
-            :return: List containing query results, or empty list if
-            the query failed.
-            """
-            if len(job) > 1 and job[1] in ('A', 'B'):
-                _arg = SIDE_DICT['inv'][job[1]]
-                _answer = self.handle_query(f"VM {_arg}")
+        :return: The job that was sent as an argument. Returns empty
+        list if the job could not be completed. A 'command' job carries
+        a concurrent.futures.Future as its third element, which is set
+        to the radio's reply, or to an empty list if there was none.
+        """
+        handler = self._job_handlers.get(job[0])
+        if handler is None:
+            return job
+        return handler(job, msg_queue)
+
+    def _get_arg_list(self, job: list) -> list:
+        """
+        Creates a CAT command argument list because some CAT
+        commands require interim CAT queries to construct
+        the user's query.
+        :param job: list containing job
+        :return: List containing query results, or empty list if
+        the query failed.
+        """
+        if len(job) > 1 and job[1] in ('A', 'B'):
+            _arg = _SIDE_INV[job[1]]
+            # Use the mode read by the last refresh. Jobs that change the
+            # mode clear it, and then the radio is asked.
+            _m = _MODE_INV.get(self.state[job[1]]['mode'])
+            if _m is None:
+                _answer = self.query(f"VM {_arg}")
                 if not _answer:
                     return []
-                _, _, _m = list(_answer)
-                if _m == '0':  # vfo
-                    cmd = 'FO'
-                elif _m == '1':  # mr
-                    cmd = 'ME'
-                    _answer = self.handle_query(f"MR {_arg}")
-                    if not _answer:
-                        return []
-                    _arg = _answer[2]  # Get the channel number
-                elif _m == '2':  # call
-                    cmd = 'CC'
-                else:  # wx
-                    cmd = 'VM'
-                    _arg = f"{_arg},3"
-                _answer = self.handle_query(f"{cmd} {_arg}")
+                _, _, _m = _answer
+            if _m == '0':  # vfo
+                cmd = 'FO'
+            elif _m == '1':  # mr
+                cmd = 'ME'
+            elif _m == '2':  # call
+                cmd = 'CC'
+            else:  # wx
+                cmd = 'VM'
+            side = _arg
+            frame = self._frames.get(side)
+            if frame is not None and frame[1][0] == cmd and \
+                    time.monotonic() - frame[0] < self._FRAME_TTL:
+                # Channel data read or written moments ago
+                return list(frame[1])
+            if cmd == 'ME':
+                _answer = self.query(f"MR {_arg}")
                 if not _answer:
                     return []
-                else:
-                    return list(_answer)
-            else:
+                _arg = _answer[2]  # Get the channel number
+            elif cmd == 'VM':
+                _arg = f"{_arg},3"
+            _answer = self.query(f"{cmd} {_arg}")
+            if not _answer:
                 return []
+            else:
+                return _answer
+        else:
+            return []
 
-        def get_ptt_ctrl() -> tuple:
-            """
-            Retrieves current PTT and CTRL state of radio
-            :return: Tuple (CTRL_state, PTT_state) where CTRL_state and
-            PTT_state are 0 or 1. Returns empty tuple if unable to
-            retrieve data
-            """
-            _answer = self.handle_query("BC")
-            if not _answer:
-                return ()
-            return _answer[1], _answer[2]
+    def _job_mode(self, job: list, msg_queue: Queue) -> list:
+        """
+        Changes the mode (VFO, Memory, Call, WX) of a side of the radio
+        with the VM command, keeping CTRL and PTT where they were
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        # Save current CTRL state because radio will move CTRL to the
+        # side of the radio that's changing modes. Will restore
+        # state later.
+        ptt_ctrl_state = self._get_ptt_ctrl()
+        if not ptt_ctrl_state:
+            return []
+        arg = f"VM {_SIDE_INV[job[1]]},{job[2]}"
+        self._cache_bc(None)
+        self.state[job[1]]['mode'] = None
+        self._last_replies = None
+        self._frames.pop(_SIDE_INV[job[1]], None)
+        if not self.query(arg):
+            return []
+        # Restore original PTT, CTRL state
+        _ctrl, _ptt = ptt_ctrl_state
+        if not self.query(f"BC {_ctrl},{_ptt}"):
+            return []
+        return job
 
-        if job[0] in ('mode',):  # 'VM' command - mode change requested
-            # Save current CTRL state because radio will move CTRL to the
-            # side of the radio that's changing modes. Will restore
-            # state later.
-            ptt_ctrl_state = get_ptt_ctrl()
-            if not ptt_ctrl_state:
-                return []
-            arg = f"VM {SIDE_DICT['inv'][job[1]]},{job[2]}"
-            if not self.handle_query(arg):
-                return []
-            # Restore original PTT, CTRL state
-            _ctrl, _ptt = ptt_ctrl_state
-            if not self.handle_query(f"BC {_ctrl},{_ptt}"):
-                return []
-        elif job[0] in ('ptt', 'ctrl'):  # 'BC' command
-            answer = get_ptt_ctrl()
-            if not answer:
-                return []
-            ctrl, ptt = answer
-            if job[0] == 'ptt':
-                arg = f"BC {ctrl},{SIDE_DICT['inv'][job[1]]}"
-            else:  # Setting ctrl
-                arg = f"BC {SIDE_DICT['inv'][job[1]]},{ptt}"
-            if not self.handle_query(arg):
-                return []
-        elif job[0] in ('power',):  # 'PC' command
-            arg = f"PC {SIDE_DICT['inv'][job[1]]},{job[2]}"
-            if not self.handle_query(arg):
-                return []
-        elif job[0] in ('lock',):
-            answer = self.handle_query("LK")
-            if not answer:
-                return []
-            arg = "LK {}".format('1' if answer[1] == '0' else '0')
-            if not self.handle_query(arg):
-                return []
-        elif job[0] in ('frequency', 'modulation', 'step',
-                        'tone', 'tone_frequency', 'rev', 'shift'):
-            arg_list = get_arg_list()
-            if not arg_list or arg_list[0] == 'N':
-                return []
-            if arg_list[0] not in ['CC', 'FO', 'ME']:
-                # WX or unknown mode. Skip this job.
-                job[0] = None
-            if job[0] in ('tone', 'tone_frequency'):
-                same_type = False
-                for key, value in TONE_TYPE_DICT['map'].items():
-                    if arg_list[int(key)] == '1':
-                        # Found the current tone type
-                        current_type = key
-                        if job[0] == 'tone' and job[2] == key:
-                            # Requested tone type is the same as current
-                            same_type = True
-                        break
-                else:  # Current type is 'No Tone'
-                    current_type = '0'  # No Tone
-                    if current_type == job[2]:
-                        same_type = True
-                if job[0] == 'tone' and not same_type:
-                    # Need to change the tone type.
-                    # Set all tones to off for now...
-                    # t is tone freq., c is CTCSS freq., d is DCS freq.
-                    _, t, c, d = list(TONE_TYPE_DICT['map'].keys())
-                    arg_list[int(t)] = '0'
-                    arg_list[int(c)] = '0'
-                    arg_list[int(d)] = '0'
-                    if job[2] != '0':
-                        # Change to requested tone type
-                        arg_list[int(job[2])] = '1'
-                # Also set the tone frequency for the new tone
-                # type to the first dictionary entry for that
-                # type because don't know what the user will
-                # want it to be. Tone frequency is always 3
-                # elements up in the list from the tone type
-                if job[0] == 'tone_frequency' and current_type != '0':
-                    arg_list[int(current_type) + 3] = \
-                        TONE_FREQUENCY_DICT[current_type]['inv'][job[2]]
-            if job[0] == 'frequency':
-                arg_list[2] = f"{int(job[2] * 1000000):010d}"
-                arg_list[4] = frequency_shifts(int(job[2] * 1000000))[0]
-                arg_list[12] = frequency_shifts(int(job[2] * 1000000))[1]
-            if job[0] == 'modulation':
-                arg_list[13] = job[2]
-            if job[0] == 'step':
-                arg_list[3] = job[2]
-            if job[0] == 'shift':
-                arg_list[4] = job[2]
-            # if job[0] == 'rev' and arg_list[4] != '0':
-            if job[0] == 'rev':
-                _freq = int(arg_list[2])
-                if arg_list[5] == '0':
-                    # Change *TO* REV state
-                    arg_list[5] = '1'
-                    # Shift frequency
-                    if arg_list[4] == '1':
-                        # Shift +: add offset
-                        _freq += int(arg_list[12])
-                    if arg_list[4] == '2':
-                        # Shift -: add offset
-                        _freq -= int(arg_list[12])
-                else:
-                    # Change *FROM* REV state
-                    arg_list[5] = '0'
-                    # Unshift frequency
-                    if arg_list[4] == '1':
-                        _freq -= int(arg_list[12])
-                    if arg_list[4] == '2':
-                        _freq += int(arg_list[12])
-                arg_list[2] = f"{_freq:010d}"
+    def _job_bc(self, job: list, msg_queue: Queue) -> list:
+        """
+        Moves PTT or CTRL to a side of the radio with the BC command
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        answer = self._get_ptt_ctrl()
+        if not answer:
+            return []
+        ctrl, ptt = answer
+        if job[0] == 'ptt':
+            arg = f"BC {ctrl},{_SIDE_INV[job[1]]}"
+        else:  # Setting ctrl
+            arg = f"BC {_SIDE_INV[job[1]]},{ptt}"
+        self._cache_bc(None)
+        if not self.query(arg):
+            return []
+        return job
+
+    def _job_power(self, job: list, msg_queue: Queue) -> list:
+        """
+        Sets the output power of a side of the radio with the PC command
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        arg = f"PC {_SIDE_INV[job[1]]},{job[2]}"
+        if not self.query(arg):
+            return []
+        return job
+
+    def _job_lock(self, job: list, msg_queue: Queue) -> list:
+        """
+        Toggles the radio's key lock with the LK command
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        answer = self._query_refreshed("LK")
+        if not answer:
+            return []
+        arg = "LK {}".format(_TOGGLE[answer[1]])
+        if not self.query(arg):
+            return []
+        return job
+
+    def _job_edit(self, job: list, msg_queue: Queue) -> list:
+        """
+        Changes one setting of the VFO, memory or call channel of a
+        side of the radio with the FO, ME or CC command. Asks the user
+        before modifying a memory channel.
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        arg_list = self._get_arg_list(job)
+        if not arg_list or arg_list[0] == 'N':
+            return []
+        if arg_list[0] not in ['CC', 'FO', 'ME']:
+            # WX or unknown mode. Skip this job.
+            job[0] = None
+        elif not _ARG_LIST_EDITS[job[0]](arg_list, job):
+            # Nothing to change
+            return job
+        if arg_list[0] == 'ME':
+            side = _SIDE_INV[job[1]]
+            vfo_mode = f"VM {side},0"
+            mem_num = int(arg_list[1])
+            # MR mode - If GUI, ask user to confirm modification of
+            # memory location
+            # First, determine whether memory contains a frequency
+            # that's allowed as a VFO on this side of the radio
+            #    Toggle to VFO mode, get the VFO for this side, then
+            #    toggle back to Memory mode, unless the VFO was read
+            #    recently
+            cached = self._vfo_cache.get(side)
+            if cached is not None and \
+                    time.monotonic() - cached[0] < self._VFO_TTL:
+                vfo_hz = cached[1]
             else:
-                pass
-            if arg_list[0] == 'ME':
-                # MR mode - If GUI, ask user to confirm modification of
-                # memory location
-                # First, determine whether memory contains a frequency
-                # that's allowed as a VFO on this side of the radio
-                #    Toggle to VFO mode and get the VFO for this side
-                if not self.handle_query(f"VM {SIDE_DICT['inv'][job[1]]},0"):
-                    return []
-                result = self.handle_query(f"FO {SIDE_DICT['inv'][job[1]]}")
-                if not result:
-                    return []
-                # Toggle back to Memory mode
-                if not self.handle_query(f"VM {SIDE_DICT['inv'][job[1]]},1"):
-                    return []
-                # Is the VFO frequency in the same band as the memory freq?
-                if same_frequency_band(int(result[2]), int(arg_list[2])):
-                    answer = self.ask('yesnocancel',
-                                      f"You are about to modify memory "
-                                      f"{int(arg_list[1])}. Proceed?\n\n"
-                                      f"Yes:    Modify mem {int(arg_list[1])}\n"
-                                      f"No:     Copy mem {int(arg_list[1])} to VFO,\n\t"
-                                      f"then modify VFO\n"
-                                      f"Cancel: Do nothing")
-                else:
-                    # Copying memory contents to VFO is not possible
-                    # because mem frequency is out of band for VFO on this
-                    # side of the radio.
-                    answer = self.ask('okcancel',
-                                      f"You are about to modify memory "
-                                      f"{int(arg_list[1])}. Continue?")
-                    if not answer:
-                        answer = None
-                if answer:
-                    # User clicked Yes/OK, so modify memory location
-                    msg_queue.put(['WARNING',
-                                   f"{stamp()}: WARNING: Modifying "
-                                   f"memory {int(arg_list[1])}!"])
-                elif answer is None:
-                    # User cancelled
-                    job[0] = None
-                else:
-                    # User clicked No
-                    # Change to VFO mode and set VFO to data from memory location
-                    msg_queue.put(['INFO',
-                                   f"{stamp()}: Copying memory "
-                                   f"{int(arg_list[1])} contents to VFO"])
-
-                    if not self.handle_query(f"VM {SIDE_DICT['inv'][job[1]]},0"):
-                        return []
-                    arg_list[0] = 'FO'
-                    arg_list[1] = SIDE_DICT['inv'][job[1]]
-                    del arg_list[14:]
-            if job[0] is not None:
-                if not self.handle_query(f"{arg_list[0]} {','.join(arg_list[1:])}"):
+                replies = self.query_batch([vfo_mode, f"FO {side}",
+                                            f"VM {side},1"])
+                if not replies or not all(replies):
+                    # The side may have been left in VFO mode
+                    self.state[job[1]]['mode'] = None
+                    self._last_replies = None
                     return []
-        elif job[0] in ('beep', 'vhf_aip', 'uhf_aip', 'speed',
-                        'backlight', 'apo', 'data', 'timeout'):
-            # Get the current menu state
-            mu = self.handle_query('MU')
-            if not mu:
-                return []
-            mu_list = list(mu)
-
-            if job[0] == 'backlight':
-                if self.state['backlight'] == 'green':
-                    desired_color = 'amber'
-                else:
-                    desired_color = 'green'
-                mu_list[MENU_DICT['backlight']['index']] = \
-                    MENU_DICT['backlight']['values'][desired_color]
-            elif job[0] == 'data':
-                mu_list[38] = job[1]
-            elif job[0] == 'speed':
-                mu_list[39] = job[1]
-            elif job[0] == 'timeout':
-                mu_list[16] = job[1]
-            elif job[0] == 'vhf_aip':
-                mu_list[11] = '0' if mu_list[11] == '1' else '1'
-            elif job[0] == 'uhf_aip':
-                mu_list[12] = '0' if mu_list[12] == '1' else '1'
+                vfo_hz = int(replies[1][2])
+                self._vfo_cache[side] = (time.monotonic(), vfo_hz)
+            # Is the VFO frequency in the same band as the memory freq?
+            if same_frequency_band(vfo_hz, int(arg_list[2])):
+                answer = self.ask('yesnocancel',
+                                  f"You are about to modify memory "
+                                  f"{mem_num}. Proceed?\n\n"
+                                  f"Yes:    Modify mem {mem_num}\n"
+                                  f"No:     Copy mem {mem_num} to VFO,\n\t"
+                                  f"then modify VFO\n"
+                                  f"Cancel: Do nothing")
             else:
-                pass
-            arg = f"MU {','.join(mu_list[1:])}"
-            if not self.handle_query(arg):
-                return []
-            # Workaround for screen refresh bug: Move CTRL to
-            # opposite side and back to refresh screen so that
-            # radio state updates correctly.
-            if job[0] == 'data':
-                bc = self.handle_query('BC')
-                if not bc:
-                    return []
-                _error = False
-                for _ in range(2):
-                    if bc[1] == '0':
-                        ctrl_temp = '1'
-                    else:
-                        ctrl_temp = '0'
-                    bc = self.handle_query(f"BC {ctrl_temp},{bc[2]}")
-                    if not bc:
-                        _error = True
-                        # return []
-                if _error:
+                # Copying memory contents to VFO is not possible
+                # because mem frequency is out of band for VFO on this
+                # side of the radio.
+                answer = self.ask('okcancel',
+                                  f"You are about to modify memory "
+                                  f"{mem_num}. Continue?")
+                if not answer:
+                    answer = None
+            if answer:
+                # User clicked Yes/OK, so modify memory location
+                _emit(msg_queue, 'WARNING',
+                      f"WARNING: Modifying memory {mem_num}!")
+            elif answer is None:
+                # User cancelled
+                job[0] = None
+            else:
+                # User clicked No
+                # Change to VFO mode and set VFO to data from memory location
+                _emit(msg_queue, 'INFO',
+                      f"Copying memory {mem_num} contents to VFO")
+
+                self.state[job[1]]['mode'] = None
+                self._last_replies = None
+                if not self.query(vfo_mode):
                     return []
-        elif job[0] in ('up', 'down'):
-            arg_list = get_arg_list()  # Get the channel data for current mode
-            if not arg_list or arg_list[0] == 'N':
+                arg_list[0] = 'FO'
+                arg_list[1] = side
+                del arg_list[14:]
+        if job[0] is not None:
+            if arg_list[0] == 'FO':
+                self._vfo_cache.pop(arg_list[1], None)
+            side = _SIDE_INV[job[1]]
+            if not self.query(_cat_command(arg_list)):
+                self._frames.pop(side, None)
                 return []
-            if arg_list[0] in ('FO',):
-                frequency = int(arg_list[2])
-                step = int(STEP_DICT['map'][arg_list[3]]) * 1000
-                if job[0] == 'down':
-                    step *= -1
-                frequency += step
-                _min = float(FREQUENCY_LIMITS[job[1]]['min']) * 1000000
-                _max = float(FREQUENCY_LIMITS[job[1]]['max']) * 1000000
-                # print(f"min = {_min}, max = {_min}")
-                if _min <= frequency <= _max:
-                    arg_list[2] = f"{frequency:010d}"
-                    arg_list[4] = frequency_shifts(frequency)[0]
-                    arg_list[5] = '0'  # Disable reverse
-                    # arg_list[6] = '0'  # Set tone status to no tone
-                    # arg_list[7] = '0'  # Set CTCSS status to no CTCSS
-                    # arg_list[8] = '0'  # Set DCS status to no DCS
-                    # arg_list[9] = '08'  # Set tone frequency to default
-                    # arg_list[10] = '08'  # Set CTCSS frequency to default
-                    # arg_list[11] = '000'  # Set DCS frequency to default
-                    arg_list[12] = frequency_shifts(frequency)[1]
-                    # arg_list[13] = '0'  # Set mode to FM
-                    arg = f"{arg_list[0]} {','.join(arg_list[1:])}"
-                    _ans = self.handle_query(arg)
-                    if not _ans:
-                        return []
-                else:
-                    msg_queue.put(['ERROR',
-                                   f"{stamp()}: Frequency "
-                                   f"must be between {float(FREQUENCY_LIMITS[job[1]]['min']):.3f} "
-                                   f"and {float(FREQUENCY_LIMITS[job[1]]['max']):.3f} MHz"])
-            elif arg_list[0] in ('ME',):
-                ctrl_moved_temporarily = False
-                if self.state[job[1]]['ctrl'] != 'CTRL':
-                    ctrl_moved_temporarily = True
-                    ctrl = 0 if self.state['A']['ctrl'] == 'CTRL' else 1
-                    ptt = 0 if self.state['A']['ptt'] == 'PTT' else 1
-                    restore_arg = f"BC {ctrl},{ptt}"
-                    arg = f"BC {SIDE_DICT['inv'][job[1]]},{ptt}"
-                    if not self.handle_query(arg):
-                        return []
-                if 'up' in job[0]:
-                    arg = "UP"
-                else:
-                    arg = "DW"
-                if not self.handle_query(arg):
-                    return []
-                if ctrl_moved_temporarily:
-                    # Restore original CTRL state
-                    # noinspection PyUnboundLocalVariable
-                    if not self.handle_query(restore_arg):
-                        return []
+            self._frames[side] = (time.monotonic(), arg_list)
+        return job
+
+    def _job_menu(self, job: list, msg_queue: Queue) -> list:
+        """
+        Changes one of the radio's menu settings with the MU command
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        # Get the current menu state
+        mu_list = self._query_refreshed('MU')
+        if not mu_list:
+            return []
+
+        if job[0] == 'backlight':
+            if self.state['backlight'] == 'green':
+                desired_color = 'amber'
             else:
-                pass
-        elif job[0] in ('ch_number',):
-            arg_list = get_arg_list()  # Get the channel data for current mode
-            if not arg_list or arg_list[0] == 'N':
+                desired_color = 'green'
+            mu_list[_BACKLIGHT_MENU['index']] = \
+                _BACKLIGHT_MENU['values'][desired_color]
+        elif job[0] in _MENU_SETTERS:
+            mu_list[_MENU_SETTERS[job[0]]] = job[1]
+        elif job[0] in _MENU_TOGGLES:
+            index = _MENU_TOGGLES[job[0]]
+            mu_list[index] = _TOGGLE[mu_list[index]]
+        else:
+            pass
+        arg = _cat_command(mu_list)
+        if not self.query(arg):
+            return []
+        # Workaround for screen refresh bug: Move CTRL to
+        # opposite side and back to refresh screen so that
+        # radio state updates correctly.
+        if job[0] == 'data':
+            ptt_ctrl_state = self._get_ptt_ctrl()
+            if not ptt_ctrl_state:
                 return []
-            if arg_list[0] == 'ME':
-                arg = f"MR {'0' if job[1] == 'A' else '1'},{job[2]}"
-                _ans = self.handle_query(arg)
+            _ctrl, _ptt = ptt_ctrl_state
+            ctrl_temp = _TOGGLE[_ctrl]
+            self._cache_bc(None)
+            replies = self.query_batch([f"BC {ctrl_temp},{_ptt}",
+                                        f"BC {_ctrl},{_ptt}"])
+            if not replies or not all(replies):
+                return []
+        return job
+
+    def _job_step(self, job: list, msg_queue: Queue) -> list:
+        """
+        Steps the VFO frequency or memory channel of a side of the
+        radio up or down
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        # Get the channel data for current mode
+        arg_list = self._get_arg_list(job)
+        if not arg_list or arg_list[0] == 'N':
+            return []
+        if arg_list[0] in ('FO',):
+            frequency = int(arg_list[2])
+            step = _STEP_HZ[arg_list[3]]
+            if job[0] == 'down':
+                step *= -1
+            frequency += step
+            _min, _max = _FREQUENCY_LIMITS_HZ[job[1]]
+            # print(f"min = {_min}, max = {_min}")
+            if _min <= frequency <= _max:
+                arg_list[2] = str(frequency).zfill(10)
+                arg_list[4], arg_list[12] = frequency_shifts(frequency)
+                arg_list[5] = '0'  # Disable reverse
+                # arg_list[6] = '0'  # Set tone status to no tone
+                # arg_list[7] = '0'  # Set CTCSS status to no CTCSS
+                # arg_list[8] = '0'  # Set DCS status to no DCS
+                # arg_list[9] = '08'  # Set tone frequency to default
+                # arg_list[10] = '08'  # Set CTCSS frequency to default
+                # arg_list[11] = '000'  # Set DCS frequency to default
+                # arg_list[13] = '0'  # Set mode to FM
+                arg = _cat_command(arg_list)
+                self._vfo_cache.pop(arg_list[1], None)
+                _ans = self.query(arg)
                 if not _ans:
+                    self._frames.pop(arg_list[1], None)
                     return []
-                elif _ans[0] == 'N':
-                    msg_queue.put(['ERROR',
-                                   f"{stamp()}: Memory "
-                                   f"{int(job[2])} is empty"])
-        elif job[0] in ('micup', 'micdown',):
-            if job[0] == 'micup':
-                arg = "UP"
+                self._frames[arg_list[1]] = (time.monotonic(), arg_list)
             else:
-                arg = "DW"
-            if not self.handle_query(arg):
-                return []
-        elif job[0] == 'cat_ptt':
-            if not self.handle_query(job[1]):
-                return []
-        elif job[0] == 'command':
-            # Wait for reply_queue to empty before accepting command.
-            self.reply_queue.join()
-            result = self.handle_query(job[1])
-            if not result:
+                _emit(msg_queue, 'ERROR',
+                      f"Frequency must be between "
+                      f"{float(FREQUENCY_LIMITS[job[1]]['min']):.3f} "
+                      f"and {float(FREQUENCY_LIMITS[job[1]]['max']):.3f} MHz")
+        elif arg_list[0] in ('ME',):
+            # The memory channel is about to change
+            self._frames.pop(_SIDE_INV[job[1]], None)
+            requests = [_KEY_COMMANDS[job[0]]]
+            if self.state[job[1]]['ctrl'] != 'CTRL':
+                # UP/DW act on the CTRL side, so move CTRL to this side
+                # first and restore it afterwards
+                ctrl = _TOGGLE[_SIDE_INV[job[1]]]
+                ptt = '0' if self.state['A']['ptt'] == 'PTT' else '1'
+                requests = [f"BC {_SIDE_INV[job[1]]},{ptt}", *requests,
+                            f"BC {ctrl},{ptt}"]
+                self._cache_bc(None)
+            replies = self.query_batch(requests)
+            if not replies or not all(replies):
                 return []
-            else:
-                self.reply_queue.put(result)
         else:
             pass
         return job
+
+    def _job_ch_number(self, job: list, msg_queue: Queue) -> list:
+        """
+        Recalls a memory channel on a side of the radio
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        # Get the channel data for current mode
+        arg_list = self._get_arg_list(job)
+        if not arg_list or arg_list[0] == 'N':
+            return []
+        if arg_list[0] == 'ME':
+            arg = f"MR {_SIDE_INV[job[1]]},{job[2]}"
+            self._frames.pop(_SIDE_INV[job[1]], None)
+            _ans = self.query(arg)
+            if not _ans:
+                return []
+            elif _ans[0] == 'N':
+                _emit(msg_queue, 'ERROR', f"Memory {int(job[2])} is empty")
+        return job
+
+    def _job_mic(self, job: list, msg_queue: Queue) -> list:
+        """
+        Sends the microphone UP or DW key
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        # The key changes the frequency or channel of the CTRL side
+        self._frames.clear()
+        if not self.query(_KEY_COMMANDS[job[0]]):
+            return []
+        return job
+
+    def _job_cat_ptt(self, job: list, msg_queue: Queue) -> list:
+        """
+        Sends a CAT TX or RX command for CAT PTT
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        if not self.query(job[1]):
+            return []
+        return job
+
+    def _job_command(self, job: list, msg_queue: Queue) -> list:
+        """
+        Sends an arbitrary CAT command and hands the radio's reply to
+        the Future in job[2], or an empty list if there was no reply.
+        If the command raises, the Future gets the exception instead
+        :param job: list containing job
+        :param msg_queue: Queue to which to send status messages
+        :return: The job, or empty list if it could not be completed
+        """
+        try:
+            if job[1].strip()[:2].upper() in ('MN', 'ME'):
+                # Command might change a channel name
+                self._mn_cache.clear()
+            # ...or the PTT and CTRL sides, the VFOs, the menu, the lock or
+            # the mode or channel data of a side
+            self._cache_bc(None)
+            self._vfo_cache.clear()
+            self._refresh_cache.clear()
+            self._frames.clear()
+            self.state['A']['mode'] = self.state['B']['mode'] = None
+            self._last_replies = None
+            result = self.query(job[1])
+        except Exception as e:
+            # Don't leave the thread waiting for the reply blocked
+            job[2].set_exception(e)
+            raise
+        # Hand the reply to the thread waiting for it
+        job[2].set_result(result or [])
+        if not result:
+            return []
+        return job
@@ -51,15 +51,28 @@ if __name__ == "__main__":
                         metavar="[1024-65535]", default=XMLRPC_PORT,
                         help="TCP port on which XML-RPC server is listening.")
     parser.add_argument('command', metavar='command', type=str,
-                        help="CAT command to send to 710.py")
+                        nargs='?', default=None,
+                        help="CAT command to send to 710.py. If omitted "
+                             "and stdin is not a terminal, commands are read "
+                             "from stdin, one per line, and sent over a "
+                             "single connection")
 
     arg_info = parser.parse_args()
+    if arg_info.command is not None:
+        commands = [arg_info.command]
+    elif not sys.stdin.isatty():
+        commands = (line.strip() for line in sys.stdin)
+    else:
+        parser.error("command is required when stdin is a terminal")
 
     transport_xml = TimeoutTransport(timeout=10)
     with xmlrpc.client.ServerProxy(f"http://{arg_info.server}:{arg_info.xmlport}/RPC2",
                                    transport=transport_xml) as proxy:
         try:
-            print(f"{proxy.rig.command(arg_info.command)}")
+            # The proxy keeps its HTTP/1.1 connection open between calls
+            for command in commands:
+                if command:
+                    print(f"{proxy.rig.command(command)}", flush=True)
         except xmlrpc.client.Fault as error:
             print(f"xmlrpc fault: {error}", file=sys.stderr)
             sys.exit(1)
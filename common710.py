@@ -1,4 +1,7 @@
-import datetime
+import time
+from bisect import bisect_right
+from functools import lru_cache
+from types import MappingProxyType
 
 __all__ = [
     'XMLRPC_PORT',
@@ -17,6 +20,7 @@ __all__ = [
     'STEP_DICT',
     'SHIFT_DICT',
     'DATA_BAND_DICT',
+    'DATA_SIDE_MAP',
     'DATA_SPEED_DICT',
     'TIMEOUT_DICT',
     'APO_DICT',
@@ -35,7 +39,6 @@ __all__ = [
     'stamp',
     'within_frequency_limits',
     'same_frequency_band',
-    'QueryException',
     'UpdateDisplayException',
     'frequency_shifts',
     'VENDOR_ID',
@@ -46,24 +49,30 @@ __all__ = [
 XMLRPC_PORT = 12345
 
 
-class QueryException(Exception):
-    """
-    Raise this exception when an error occurs while querying radio
-    """
-
-
 class UpdateDisplayException(Exception):
     """
     Raise this exception when an error occurs updating the GUI display
     """
 
 
+# (second since the epoch, stamp() string for it). Replaced as a whole,
+# so threads calling stamp() never see a mismatched pair.
+_stamp_cache = (0, '')
+
+
 def stamp() -> str:
     """
-    Returns string formatted with current time
+    Returns string formatted with current time. The string only changes
+    once a second, so it is formatted once per second.
     :return: String
     """
-    return datetime.datetime.now().strftime('%Y%m%dT%H%M%S')
+    global _stamp_cache
+    now = int(time.time())
+    cached = _stamp_cache
+    if cached[0] != now:
+        cached = (now, time.strftime('%Y%m%dT%H%M%S', time.localtime(now)))
+        _stamp_cache = cached
+    return cached[1]
 
 
 def within_frequency_limits(side: str, freq: float) -> bool:
@@ -74,12 +83,20 @@ def within_frequency_limits(side: str, freq: float) -> bool:
     :param: freq: Float with frequency in Hz.
     :return: True if within defined range, False otherwise
     """
-    _min = FREQUENCY_LIMITS[side]['min']
-    _max = FREQUENCY_LIMITS[side]['max']
-    if _min <= freq <= _max:
-        return True
-    else:
-        return False
+    return _LIMIT_CHECKERS[side](freq)
+
+
+def _limit_checker(_min: float, _max: float):
+    """
+    Makes a function that checks a frequency against fixed limits
+    :param _min: Lowest allowed frequency
+    :param _max: Highest allowed frequency
+    :return: Function that takes a frequency and returns True if it is
+    within the limits, False otherwise
+    """
+    def check(freq: float) -> bool:
+        return _min <= freq <= _max
+    return check
 
 
 def same_frequency_band(freq1: int, freq2: int) -> bool:
@@ -90,16 +107,36 @@ def same_frequency_band(freq1: int, freq2: int) -> bool:
     :return: True if both freq1 and freq2 are in the same band,
     False otherwise
     """
-    same_band = False
-    for freq_range in FREQUENCY_BAND_LIMITS.values():
-        if freq1 in range(freq_range['min'], freq_range['max']) \
-                and freq2 in range(freq_range['min'],
-                                   freq_range['max']):
-            same_band = True
-            break
-    return same_band
+    band = _frequency_band(freq1)
+    return band is not None and band == _frequency_band(freq2)
 
 
+def _frequency_band(freq: int):
+    """
+    Finds the amateur radio band a frequency is in
+    :param freq: Frequency in Hz
+    :return: Index of the band in _BAND_STARTS, or None if freq is not
+    in any band in FREQUENCY_BAND_LIMITS
+    """
+    i = bisect_right(_BAND_STARTS, freq) - 1
+    if i >= 0 and freq < _BAND_ENDS[i]:
+        return i
+    return None
+
+
+# Repeater shift and offset of the frequencies from each lower to upper
+# limit (both inclusive), sorted by frequency. Others are simplex.
+_SHIFT_RANGES = ((145100000, 145499900, ('2', '00600000')),
+                 (146000000, 146399000, ('1', '00600000')),
+                 (146600000, 146999000, ('2', '00600000')),
+                 (147000000, 147399000, ('1', '00600000')),
+                 (147600000, 147999000, ('2', '00600000')),
+                 (442000000, 444999000, ('1', '05000000')),
+                 (447000000, 449999000, ('2', '05000000')))
+_SHIFT_STARTS = tuple(r[0] for r in _SHIFT_RANGES)
+
+
+@lru_cache(maxsize=4096)
 def frequency_shifts(frequency: int) -> tuple:
     """
     Given a frequency, it returns a value that translates to whether
@@ -108,22 +145,10 @@ def frequency_shifts(frequency: int) -> tuple:
     :return: Tuple containing 0, 1 or 2 (simplex, up or down
     respectively) and shift frequency in Hz
     """
-    if 145100000 <= frequency <= 145499900:
-        return '2', '00600000'
-    elif 146000000 <= frequency <= 146399000:
-        return '1', '00600000'
-    elif 146600000 <= frequency <= 146999000:
-        return '2', '00600000'
-    elif 147000000 <= frequency <= 147399000:
-        return '1', '00600000'
-    elif 147600000 <= frequency <= 147999000:
-        return '2', '00600000'
-    elif 442000000 <= frequency <= 444999000:
-        return '1', '05000000'
-    elif 447000000 <= frequency <= 449999000:
-        return '2', '05000000'
-    else:
-        return '0', '00000000'
+    i = bisect_right(_SHIFT_STARTS, frequency) - 1
+    if i >= 0 and frequency <= _SHIFT_RANGES[i][1]:
+        return _SHIFT_RANGES[i][2]
+    return '0', '00000000'
 
 
 NEXUS_PTT_GPIO_DICT = {'left': '12', 'right': '23'}
@@ -141,30 +166,46 @@ OTHER_PTT = ['digirig', 'cm108']
 #                  }
 FREQUENCY_LIMITS = {'A': {'min': 118.0, 'max': 524.0},
                     'B': {'min': 136.0, 'max': 1300.0}}
+# within_frequency_limits check for each side of the radio
+_LIMIT_CHECKERS = {k: _limit_checker(v['min'], v['max'])
+                   for k, v in FREQUENCY_LIMITS.items()}
 MEMORY_LIMITS = {'min': 0, 'max': 999}
 FREQUENCY_BAND_LIMITS = {'118': {'min': 118000000, 'max': 136000000},
                          '144': {'min': 136000000, 'max': 200000000},
                          '220': {'min': 200000000, 'max': 300000000},
                          '440': {'min': 400000000, 'max': 524000000},
                          '1200': {'min': 800000000, 'max': 1300000000}}
+# Lower (inclusive) and upper (exclusive) edges of the bands in
+# FREQUENCY_BAND_LIMITS, sorted by frequency, for same_frequency_band
+_BAND_STARTS, _BAND_ENDS = zip(*sorted(
+    (v['min'], v['max']) for v in FREQUENCY_BAND_LIMITS.values()))
+
+
+def _bimap(values: dict) -> dict:
+    """
+    Builds a lookup table from CAT values to display values, and back
+    :param values: Dictionary mapping CAT values to display values
+    :return: Dictionary with read-only views: 'map' of values and 'inv'
+    of its inverse
+    """
+    return {'map': MappingProxyType(values),
+            'inv': MappingProxyType({v: k for k, v in values.items()})}
+
 
 _disp_mode_dict = {'0': 'Dual', '1': 'Single'}
-DISP_MODE_DICT = {'map': _disp_mode_dict,
-                  'inv': {v: k for k, v in _disp_mode_dict.items()}}
+DISP_MODE_DICT = _bimap(_disp_mode_dict)
 
 _side_dict = {'0': 'A', '1': 'B'}
-SIDE_DICT = {'map': _side_dict, 'inv': {v: k for k, v in _side_dict.items()}}
+SIDE_DICT = _bimap(_side_dict)
 
 _mode_dict = {'0': 'VFO', '1': 'MR', '2': 'CALL', '3': 'WX'}
-MODE_DICT = {'map': _mode_dict, 'inv': {v: k for k, v in _mode_dict.items()}}
+MODE_DICT = _bimap(_mode_dict)
 
 _modulation_dict = {'0': "FM", '1': "NFM", '2': "AM"}
-MODULATION_DICT = {'map': _modulation_dict,
-                   'inv': {v: k for k, v in _modulation_dict.items()}}
+MODULATION_DICT = _bimap(_modulation_dict)
 
 _tone_type_dict = {'0': "No Tone", '6': 'Tone', '7': 'CTCSS', '8': 'DCS'}
-TONE_TYPE_DICT = {'map': _tone_type_dict,
-                  'inv': {v: k for k, v in _tone_type_dict.items()}}
+TONE_TYPE_DICT = _bimap(_tone_type_dict)
 
 _pll_frequency_dict = {'00': "67", '01': "69.3", '02': "71.9",
                        '03': "74.4",
@@ -209,67 +250,54 @@ _dcs_frequency_dict = {'000': "23", '001': "25", '002': "26", '003': "31",
                        '092': "632", '093': "654", '094': "662", '095': "664",
                        '096': "703", '097': "712", '098': "723", '099': "731",
                        '100': "732", '101': "734", '102': "743", '103': "754"}
-DCS_FREQUENCY_DICT = {'map': _dcs_frequency_dict,
-                      'inv': {v: k for k, v in _dcs_frequency_dict.items()}}
+DCS_FREQUENCY_DICT = _bimap(_dcs_frequency_dict)
 
+_PLL_FREQUENCY_DICT = _bimap(_pll_frequency_dict)
 TONE_FREQUENCY_DICT = {'0': ' ',
                        'No Tone': ' ',
-                       '6': {'map': _pll_frequency_dict,
-                             'inv': {v: k for k, v in _pll_frequency_dict.items()}},
-                       'Tone': {'map': _pll_frequency_dict,
-                                'inv': {v: k for k, v in _pll_frequency_dict.items()}},
-                       '7': {'map': _pll_frequency_dict,
-                             'inv': {v: k for k, v in _pll_frequency_dict.items()}},
-                       'CTCSS': {'map': _pll_frequency_dict,
-                                 'inv': {v: k for k, v in _pll_frequency_dict.items()}},
-                       '8': {'map': _dcs_frequency_dict,
-                             'inv': {v: k for k, v in _dcs_frequency_dict.items()}},
-                       'DCS': {'map': _dcs_frequency_dict,
-                               'inv': {v: k for k, v in _dcs_frequency_dict.items()}},
+                       '6': _PLL_FREQUENCY_DICT,
+                       'Tone': _PLL_FREQUENCY_DICT,
+                       '7': _PLL_FREQUENCY_DICT,
+                       'CTCSS': _PLL_FREQUENCY_DICT,
+                       '8': DCS_FREQUENCY_DICT,
+                       'DCS': DCS_FREQUENCY_DICT,
                        }
 
 _power_dict = {'0': 'H', '1': 'M', '2': 'L'}
-POWER_DICT = {'map': _power_dict,
-              'inv': {v: k for k, v in _power_dict.items()}}
+POWER_DICT = _bimap(_power_dict)
 
 _state_dict = {'0': "OFF", '1': "ON"}
-STATE_DICT = {'map': _state_dict,
-              'inv': {v: k for k, v in _state_dict.items()}}
+STATE_DICT = _bimap(_state_dict)
 
 _step_dict = {'0': '5', '1': '6.25', '2': '8.33', '3': '10',
               '4': '12.5', '5': '15', '6': '20', '7': '25', '8': '30',
               '9': '50', 'A': '100'}
-STEP_DICT = {'map': _step_dict,
-             'inv': {v: k for k, v in _step_dict.items()}}
+STEP_DICT = _bimap(_step_dict)
 
 _shift_dict = {'0': 'S', '1': '+', '2': '-'}
-SHIFT_DICT = {'map': _shift_dict,
-              'inv': {v: k for k, v in _shift_dict.items()}}
+SHIFT_DICT = _bimap(_shift_dict)
 
 _data_band_dict = {'0': 'A', '1': 'B', '2': 'TX A,RX B', '3': 'TX B,RX A'}
-DATA_BAND_DICT = {'map': _data_band_dict,
-                  'inv': {v: k for k, v in _data_band_dict.items()}}
+DATA_BAND_DICT = _bimap(_data_band_dict)
+# Data indicator on the A and B sides for each DATA_BAND_DICT key
+DATA_SIDE_MAP = {'0': ('D', ' '), '1': (' ', 'D'),
+                 '2': ('D-TX', 'D-RX'), '3': ('D-RX', 'D-TX')}
 
 _data_speed_dict = {'0': '1200', '1': '9600'}
-DATA_SPEED_DICT = {'map': _data_speed_dict,
-                   'inv': {v: k for k, v in _data_speed_dict.items()}}
+DATA_SPEED_DICT = _bimap(_data_speed_dict)
 
 _timeout_dict = {'0': '3', '1': '5', '2': '10'}
-TIMEOUT_DICT = {'map': _timeout_dict,
-                'inv': {v: k for k, v in _timeout_dict.items()}}
+TIMEOUT_DICT = _bimap(_timeout_dict)
 
 _apo_dict = {'0': 'off', '1': '30', '2': '60', '3': '90',
              '4': '120', '5': '180'}
-APO_DICT = {'map': _apo_dict,
-            'inv': {v: k for k, v in _apo_dict.items()}}
+APO_DICT = _bimap(_apo_dict)
 
 _reverse_dict = {'0': ' ', '1': 'R'}
-REVERSE_DICT = {'map': _reverse_dict,
-                'inv': {v: k for k, v in _reverse_dict.items()}}
+REVERSE_DICT = _bimap(_reverse_dict)
 
 _backlight_dict = {'0': 'amber', '1': 'green'}
-BACKLIGHT_DICT = {'map': _backlight_dict,
-                  'inv': {v: k for k, v in _backlight_dict.items()}}
+BACKLIGHT_DICT = _bimap(_backlight_dict)
 _tone_status_dict = _state_dict
 TONE_STATUS_DICT = STATE_DICT
 _ctcss_status_dict = _state_dict
@@ -290,11 +318,11 @@ MENU_DICT = {'beep': {'index': 1, 'values': STATE_DICT['inv']},
                          'values': STATE_DICT['inv']},
              'uhf_aip': {'index': 12,
                          'values': STATE_DICT['inv']},
-             'backlight': {'index': 28, 'values': {'amber': '0',
-                                                   'green': '1'}},
+             'backlight': {'index': 28, 'values': BACKLIGHT_DICT['inv']},
              'apo': {'index': 37, 'values': APO_DICT['inv']},
              'data': {'index': 38, 'values': DATA_BAND_DICT['inv']},
              'speed': {'index': 39, 'values': DATA_SPEED_DICT['inv']},
+             'timeout': {'index': 16, 'values': TIMEOUT_DICT['inv']},
              }
 
 # C-Media CM1xx sound card Vendor ID
@@ -169,9 +169,12 @@ class Controller(object):
                 job = self.cmd_queue.get()  # Get job from queue
                 if job[0] == 'quit':
                     break
-                self.msg_queue.put(['INFO', f"{stamp()}: Queued {job}"])
+                # A 'command' job carries the caller's Future; keep it out
+                # of the message console.
+                job_text = job[:2] if job[0] == 'command' else job
+                self.msg_queue.put(['INFO', f"{stamp()}: Queued {job_text}"])
                 if self.cat.run_job(job, self.msg_queue):
-                    self.msg_queue.put(['INFO', f"{stamp()}: Finished {job}"])
+                    self.msg_queue.put(['INFO', f"{stamp()}: Finished {job_text}"])
                 else:
                     break
                 self.cmd_queue.task_done()
@@ -196,7 +199,7 @@ class Controller(object):
 
     def send_command(self, cmd: str) -> list:
         # This is not managed by the job queue!
-        return self.cat.handle_query(cmd)
+        return self.cat.query(cmd)
 
     def set_info(self, info: list):
         self.cat.info = info
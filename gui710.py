@@ -1,5 +1,8 @@
 import re
+from functools import partial
 import tkinter as tk
+import tkinter.font as tkfont
+from queue import Empty
 from tkinter import simpledialog
 from tkinter import messagebox
 from tkinter import ttk
@@ -28,6 +31,21 @@ __maintainer__ = "Steve Magnuson"
 __email__ = "ag7gn@arrl.net"
 __status__ = "Production"
 
+# Reverse (display value -> CAT value) lookups used by the click handlers
+_TONE_TYPE_INV = TONE_TYPE_DICT['inv']
+_SHIFT_INV = SHIFT_DICT['inv']
+_MODE_INV = MODE_DICT['inv']
+_POWER_INV = POWER_DICT['inv']
+_MODULATION_INV = MODULATION_DICT['inv']
+_STEP_INV = STEP_DICT['inv']
+_DATA_SPEED_INV = DATA_SPEED_DICT['inv']
+_TIMEOUT_INV = TIMEOUT_DICT['inv']
+# Tone frequency choices offered for each tone type
+_TONE_FREQUENCY_CHOICES = {
+    'Tone': tuple(TONE_FREQUENCY_DICT['Tone']['map'].values()),
+    'CTCSS': tuple(TONE_FREQUENCY_DICT['CTCSS']['map'].values()),
+    'DCS': tuple(DCS_FREQUENCY_DICT['map'].values())}
+
 
 class Display(object):
     """
@@ -37,6 +55,7 @@ class Display(object):
     _green = "#CCFF33"
     _amber = "#FF9933"
     _screen_bg_color = _green
+    _bg_colors = {'amber': _amber, 'green': _green}
     scale = {'normal': {'w': 790, 'h': 420, 'frame_w': 650,
                         'default_font_size': 18,
                         'frequency_font_size': 40,
@@ -54,6 +73,10 @@ class Display(object):
              }
     # screen starts at row 0, column 0
     _scr = {'row': 0, 'col': 0, 'columns': 16, 'B_side_col': 8}
+    # Screen labels that respond to mouse clicks
+    _CLICKABLE_KEYS = frozenset({'frequency', 'tone', 'tone_frequency',
+                                 'ch_name', 'shift', 'mode', 'ch_number',
+                                 'power', 'data', 'modulation', 'step'})
 
     def __init__(self, **kwargs):
         default_kwargs = {'title': 'Kenwood TM-D710G/TM-V71A Controller'}
@@ -65,12 +88,31 @@ class Display(object):
         self.info = kwargs['info']
         size = kwargs.get('size', 'normal')
         self.current_color = None
-        self._default_font = ("Tahoma",
-                              Display.scale[size]['default_font_size'])
-        self._frequency_font = ("Tahoma",
-                                Display.scale[size]['frequency_font_size'])
-        self._button_font = ("Tahoma",
-                             Display.scale[size]['button_font_size'])
+        # Font objects are shared by all widgets that use them so Tk
+        # only has to resolve each font once
+        self._default_font = tkfont.Font(
+            root=self.master, family="Tahoma",
+            size=Display.scale[size]['default_font_size'])
+        self._frequency_font = tkfont.Font(
+            root=self.master, family="Tahoma",
+            size=Display.scale[size]['frequency_font_size'])
+        self._button_font = tkfont.Font(
+            root=self.master, family="Tahoma",
+            size=Display.scale[size]['button_font_size'])
+        # Map clicked label keys to the methods that handle them
+        self._click_handlers = {'frequency': self._on_frequency,
+                                'ch_number': self._on_ch_number,
+                                'tone': self._on_tone,
+                                'tone_frequency': self._on_tone_frequency,
+                                'shift': self._on_shift,
+                                'mode': self._on_mode,
+                                'power': self._on_power,
+                                'modulation': self._on_modulation,
+                                'step': self._on_step,
+                                'speed': self._on_speed,
+                                'timeout': self._on_timeout,
+                                'data': self._on_data,
+                                }
         # labels dictionary tuples: (row, column, columnspan,
         # rowspan, sticky, font, tooltip)
 
@@ -188,6 +230,10 @@ class Display(object):
                                      'relief': 'flat'},
                             }
 
+        # Tool tip offsets
+        x_off = Display.scale[size]['x_offset']
+        y_off = Display.scale[size]['y_offset']
+
         # Make the root window
         w = Display.scale[size]['w']
         h = Display.scale[size]['h']
@@ -281,18 +327,15 @@ class Display(object):
                     master=screen_field[side][key],
                     text=key[0:2], fg="black",
                     bg=Display._screen_bg_color, font=value['font'])
-                if key in ('frequency', 'tone', 'tone_frequency',
-                           'ch_name', 'shift', 'mode', 'ch_number',
-                           'power', 'data', 'modulation', 'step'):
+                if key in Display._CLICKABLE_KEYS:
                     self.screen_label[side][key]. \
                         bind("<Button-1>",
-                             lambda _, s=side,
-                             k=key: self.widget_clicked(side=s,
-                                                        key=k))
+                             partial(self.widget_clicked,
+                                     side=side, key=key))
                 ToolTip(widget=self.screen_label[side][key],
                         text=value['tooltip'],
-                        x_offset=Display.scale[size]['x_offset'],
-                        y_offset=Display.scale[size]['y_offset'] + 10)
+                        x_offset=x_off,
+                        y_offset=y_off + 10)
                 self.screen_label[side][key]. \
                     pack(fill=tk.BOTH, expand=True)
             column_offset += Display._scr['B_side_col']
@@ -311,150 +354,150 @@ class Display(object):
                 btn_column += 1
                 screen_btn[side][key]. \
                     bind("<Button-1>",
-                         lambda _, s=side, k=key:
-                         self.widget_clicked(side=s, key=k))
+                         partial(self.widget_clicked, side=side, key=key))
                 ToolTip(widget=screen_btn[side][key],
                         text=self.screen_btns_dict[key]['tooltip'],
-                        x_offset=Display.scale[size]['x_offset'],
-                        y_offset=Display.scale[size]['y_offset'])
-
-            button_frame = ttk.Frame(master=content_frame)
-            button_frame.grid(row=6,
-                              column=0,
-                              columnspan=14,
-                              rowspan=2, pady=2)
-
-            bg_button = ttk.Label(master=button_frame,
-                                  text="Backlight Color",
-                                  anchor="center",
-                                  style='button.TLabel', relief="raised",
-                                  padding=1)
-            bg_button.grid(row=0, column=0, sticky='nsew', padx=1, ipadx=1)
-            bg_button.bind("<Button-1>",
-                           lambda _: self.cmd_q.put(['backlight', ]))
-            ToolTip(widget=bg_button,
-                    text="Click to toggle screen background color",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            self.timeout_button = \
-                ttk.Label(master=button_frame,
-                          text="TX TO", relief="raised",
-                          anchor="center",
-                          style='button.TLabel')
-
-            self.timeout_button.grid(row=0, column=1, sticky='nsew',
-                                     padx=1, ipadx=1)
-            self.timeout_button.bind("<Button-1>", lambda _:
-                                     self.widget_clicked(key='timeout'))
-            ToolTip(widget=self.timeout_button,
-                    text="Click to set TX timeout (minutes)",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            micdown_button = ttk.Label(master=button_frame,
-                                       text="Mic Down", relief="raised",
-                                       anchor="center",
-                                       style='button.TLabel')
-
-            micdown_button.grid(row=0, column=2, sticky='nsew',
-                                padx=1, ipadx=1)
-            micdown_button.bind("<Button-1>", lambda _:
-                                self.cmd_q.put(['micdown', ]))
-            ToolTip(widget=micdown_button,
-                    text="Click to emulate 'Down' button on mic",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            micup_button = ttk.Label(master=button_frame,
-                                     text="Mic Up", relief="raised",
+                        x_offset=x_off,
+                        y_offset=y_off)
+
+        button_frame = ttk.Frame(master=content_frame)
+        button_frame.grid(row=6,
+                          column=0,
+                          columnspan=14,
+                          rowspan=2, pady=2)
+
+        bg_button = ttk.Label(master=button_frame,
+                              text="Backlight Color",
+                              anchor="center",
+                              style='button.TLabel', relief="raised",
+                              padding=1)
+        bg_button.grid(row=0, column=0, sticky='nsew', padx=1, ipadx=1)
+        bg_button.bind("<Button-1>",
+                       lambda _: self.cmd_q.put(['backlight', ]))
+        ToolTip(widget=bg_button,
+                text="Click to toggle screen background color",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        self.timeout_button = \
+            ttk.Label(master=button_frame,
+                      text="TX TO", relief="raised",
+                      anchor="center",
+                      style='button.TLabel')
+
+        self.timeout_button.grid(row=0, column=1, sticky='nsew',
+                                 padx=1, ipadx=1)
+        self.timeout_button.bind("<Button-1>",
+                                 partial(self.widget_clicked,
+                                         key='timeout'))
+        ToolTip(widget=self.timeout_button,
+                text="Click to set TX timeout (minutes)",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        micdown_button = ttk.Label(master=button_frame,
+                                   text="Mic Down", relief="raised",
+                                   anchor="center",
+                                   style='button.TLabel')
+
+        micdown_button.grid(row=0, column=2, sticky='nsew',
+                            padx=1, ipadx=1)
+        micdown_button.bind("<Button-1>", lambda _:
+                            self.cmd_q.put(['micdown', ]))
+        ToolTip(widget=micdown_button,
+                text="Click to emulate 'Down' button on mic",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        micup_button = ttk.Label(master=button_frame,
+                                 text="Mic Up", relief="raised",
+                                 anchor="center",
+                                 style='button.TLabel')
+
+        micup_button.grid(row=0, column=3, sticky='nsew', padx=1,
+                          ipadx=1)
+        micup_button.bind("<Button-1>", lambda _:
+                          self.cmd_q.put(['micup', ]))
+        ToolTip(widget=micup_button,
+                text="Click to emulate 'Up' button on mic",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        self.lock_button = ttk.Label(master=button_frame,
+                                     text="Lock is", relief="raised",
                                      anchor="center",
                                      style='button.TLabel')
 
-            micup_button.grid(row=0, column=3, sticky='nsew', padx=1,
+        self.lock_button.grid(row=1, column=0, sticky='nsew', padx=1,
                               ipadx=1)
-            micup_button.bind("<Button-1>", lambda _:
-                              self.cmd_q.put(['micup', ]))
-            ToolTip(widget=micup_button,
-                    text="Click to emulate 'Up' button on mic",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            self.lock_button = ttk.Label(master=button_frame,
-                                         text="Lock is", relief="raised",
-                                         anchor="center",
-                                         style='button.TLabel')
-
-            self.lock_button.grid(row=1, column=0, sticky='nsew', padx=1,
-                                  ipadx=1)
-            self.lock_button.bind("<Button-1>", lambda _:
-                                  self.cmd_q.put(['lock', ]))
-            ToolTip(widget=self.lock_button,
-                    text="Click to toggle radio controls lock",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            self.vhf_aip_button = ttk.Label(master=button_frame,
-                                            text="VHF AIP is",
-                                            relief="raised",
-                                            anchor="center",
-                                            style='button.TLabel')
-            self.vhf_aip_button.grid(row=1, column=1, sticky='nsew', padx=1,
-                                     ipadx=1)
-            self.vhf_aip_button.bind("<Button-1>", lambda _:
-                                     self.cmd_q.put(['vhf_aip', ]))
-            ToolTip(widget=self.vhf_aip_button,
-                    text="Click to toggle VHF Advanced Intercept Point",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            self.uhf_aip_button = ttk.Label(master=button_frame,
-                                            text="VHF AIP is",
-                                            relief="raised",
-                                            anchor="center",
-                                            style='button.TLabel')
-            self.uhf_aip_button.grid(row=1, column=2, sticky='nsew', padx=1,
-                                     ipadx=1)
-            self.uhf_aip_button.bind("<Button-1>", lambda _:
-                                     self.cmd_q.put(['uhf_aip', ]))
-            ToolTip(widget=self.uhf_aip_button,
-                    text="Click to toggle UHF Advanced Intercept Point",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            self.speed_button = ttk.Label(master=button_frame,
-                                          text="Tap",
-                                          relief="raised",
-                                          anchor="center",
-                                          style='button.TLabel')
-            self.speed_button.grid(row=1, column=3, sticky='nsew', padx=1,
-                                   ipadx=1)
-            self.speed_button.bind("<Button-1>", lambda _:
-                                   self.widget_clicked(key='speed'))
-            ToolTip(widget=self.speed_button,
-                    text="Click to toggle data audio tap (1200 or 9600)",
-                    x_offset=Display.scale[size]['x_offset'],
-                    y_offset=Display.scale[size]['y_offset'])
-
-            info_quit_frame = ttk.Frame(master=content_frame)
-            info_quit_frame.grid(row=13,
-                                 column=0,
-                                 columnspan=14,
-                                 pady=2)
-
-            info_button = tk.Button(master=info_quit_frame,
-                                    text='Rig Information',
-                                    font=self._button_font,
-                                    command=lambda:
-                                    self.showinfo())
-            info_button.grid(row=0, column=0)
-
-            quit_button = tk.Button(master=info_quit_frame,
-                                    text='Quit',
-                                    font=self._button_font,
-                                    command=lambda:
-                                    self.cmd_q.put(['quit', ]))
-            quit_button.grid(row=0, column=1)
+        self.lock_button.bind("<Button-1>", lambda _:
+                              self.cmd_q.put(['lock', ]))
+        ToolTip(widget=self.lock_button,
+                text="Click to toggle radio controls lock",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        self.vhf_aip_button = ttk.Label(master=button_frame,
+                                        text="VHF AIP is",
+                                        relief="raised",
+                                        anchor="center",
+                                        style='button.TLabel')
+        self.vhf_aip_button.grid(row=1, column=1, sticky='nsew', padx=1,
+                                 ipadx=1)
+        self.vhf_aip_button.bind("<Button-1>", lambda _:
+                                 self.cmd_q.put(['vhf_aip', ]))
+        ToolTip(widget=self.vhf_aip_button,
+                text="Click to toggle VHF Advanced Intercept Point",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        self.uhf_aip_button = ttk.Label(master=button_frame,
+                                        text="VHF AIP is",
+                                        relief="raised",
+                                        anchor="center",
+                                        style='button.TLabel')
+        self.uhf_aip_button.grid(row=1, column=2, sticky='nsew', padx=1,
+                                 ipadx=1)
+        self.uhf_aip_button.bind("<Button-1>", lambda _:
+                                 self.cmd_q.put(['uhf_aip', ]))
+        ToolTip(widget=self.uhf_aip_button,
+                text="Click to toggle UHF Advanced Intercept Point",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        self.speed_button = ttk.Label(master=button_frame,
+                                      text="Tap",
+                                      relief="raised",
+                                      anchor="center",
+                                      style='button.TLabel')
+        self.speed_button.grid(row=1, column=3, sticky='nsew', padx=1,
+                               ipadx=1)
+        self.speed_button.bind("<Button-1>",
+                               partial(self.widget_clicked,
+                                       key='speed'))
+        ToolTip(widget=self.speed_button,
+                text="Click to toggle data audio tap (1200 or 9600)",
+                x_offset=x_off,
+                y_offset=y_off)
+
+        info_quit_frame = ttk.Frame(master=content_frame)
+        info_quit_frame.grid(row=13,
+                             column=0,
+                             columnspan=14,
+                             pady=2)
+
+        info_button = tk.Button(master=info_quit_frame,
+                                text='Rig Information',
+                                font=self._button_font,
+                                command=self.showinfo)
+        info_button.grid(row=0, column=0)
+
+        quit_button = tk.Button(master=info_quit_frame,
+                                text='Quit',
+                                font=self._button_font,
+                                command=partial(self.cmd_q.put,
+                                                ('quit', )))
+        quit_button.grid(row=0, column=1)
 
     def showinfo(self):
         """
@@ -468,9 +511,10 @@ class Display(object):
                             message=info,
                             parent=self.master)
 
-    def widget_clicked(self, **kwargs):
+    def widget_clicked(self, _event=None, **kwargs):
         """
         Manage user input when certain labels are clicked
+        :param _event: Tk event when called as a binding (unused)
         :param kwargs: 'side': side of the radio (A or B)
         'key': Label that was clicked
         """
@@ -489,163 +533,184 @@ class Display(object):
                 _label = str(self.screen_label[s][k].cget('text'))
                 self.msg.queue.put(['INFO', f"{stamp()}: '{k}' on side "
                                     f"{s} clicked. Value is '{_label}'"])
-        if k == 'frequency':
+        handler = self._click_handlers.get(k)
+        if handler:
+            handler(s, _label)
+
+    def _on_frequency(self, s: str, label: str):
+        k = 'frequency'
+        user_input = \
+            simpledialog.askfloat(
+                prompt=f"Enter desired frequency in MHz for "
+                       f"side {s}",
+                title=f"Side {s} frequency",
+                initialvalue=float(label),
+                minvalue=FREQUENCY_LIMITS[s]['min'],
+                maxvalue=FREQUENCY_LIMITS[s]['max'])
+        if user_input is not None:
+            self.cmd_q.put([k, s, user_input])
+
+    def _on_ch_number(self, s: str, label: str):
+        k = 'ch_number'
+        if label and label.strip():
             user_input = \
-                simpledialog.askfloat(
-                    prompt=f"Enter desired frequency in MHz for "
+                simpledialog.askinteger(
+                    prompt=f"Enter desired channel number for "
                            f"side {s}",
-                    title=f"Side {s} frequency",
-                    initialvalue=float(self.screen_label[s][k].cget('text')),
-                    minvalue=FREQUENCY_LIMITS[s]['min'],
-                    maxvalue=FREQUENCY_LIMITS[s]['max'])
+                    title=f"Side {s} channel",
+                    initialvalue=int(label),
+                    minvalue=MEMORY_LIMITS['min'],
+                    maxvalue=MEMORY_LIMITS['max'])
             if user_input is not None:
-                self.cmd_q.put([k, s, user_input])
-        elif k == 'ch_number':
-            if _label and _label.strip():
-                user_input = \
-                    simpledialog.askinteger(
-                        prompt=f"Enter desired channel number for "
-                               f"side {s}",
-                        title=f"Side {s} channel",
-                        initialvalue=int(self.screen_label[s][k].cget('text')),
-                        minvalue=MEMORY_LIMITS['min'],
-                        maxvalue=MEMORY_LIMITS['max'])
-                if user_input is not None:
-                    self.cmd_q.put([k, s, f"{int(user_input):03d}"])
-            else:
-                self.msg.queue.put(['ERROR', f"{stamp()}: Side {s} is not "
-                                             "in memory mode. Cannot set memory location."])
-        elif k == 'tone':
-            RadioPopup(widget=self.screen_label[s][k],
-                       # title=f"  Side {s} Tone Type  ",
-                       pop_label=f"Side {s} Tone Type",
-                       label=k,
-                       side=s,
-                       font=self._default_font,
-                       initial_value=TONE_TYPE_DICT['inv'][self.screen_label[s][k].cget('text')],
-                       content=TONE_TYPE_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'tone_frequency':
-            # We need to know which tone frequencies to present to user
-            tone_type = self.screen_label[s]['tone'].cget('text')
-            if tone_type in ('Tone', 'CTCSS'):
-                content = list(TONE_FREQUENCY_DICT[tone_type]['map'].values())
-            elif tone_type == 'DCS':
-                content = list(DCS_FREQUENCY_DICT['map'].values())
-            else:  # No tones in use
-                content = None
-            if content is not None:
-                ComboPopup(widget=self.screen_label[s][k],
-                           # title=f"  Side {s} Tone (Hz)  ",
-                           pop_label=f"Side {s} Tone (Hz)",
-                           label=k,
-                           side=s,
-                           font=self._default_font,
-                           content=list(TONE_FREQUENCY_DICT[tone_type]['map'].values()),
-                           job_q=self.cmd_q)
-        elif k == 'shift':
-            RadioPopup(widget=self.screen_label[s][k],
-                       # title=f"    Side {s} Shift     ",
-                       pop_label=f"Side {s} Shift",
-                       label=k,
-                       side=s,
-                       font=self._default_font,
-                       initial_value=SHIFT_DICT['inv'][self.screen_label[s][k].cget('text')],
-                       content=SHIFT_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'mode':
-            RadioPopup(widget=self.screen_label[s][k],
-                       # title=f"    Side {s} Mode     ",
-                       pop_label=f"Side {s} Mode",
-                       label=k,
-                       side=s,
-                       font=self._default_font,
-                       initial_value=MODE_DICT['inv'][self.screen_label[s][k].cget('text')],
-                       content=MODE_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'power':
-            RadioPopup(widget=self.screen_label[s][k],
-                       # title=f"   Side {s} TX Power  ",
-                       pop_label=f"Side {s} TX Power",
-                       label=k,
-                       side=s,
-                       font=self._default_font,
-                       initial_value=POWER_DICT['inv'][self.screen_label[s][k].cget('text')],
-                       content=POWER_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'modulation':
-            RadioPopup(widget=self.screen_label[s][k],
-                       # title=f"  Side {s} Modulation  ",
-                       pop_label=f"Side {s} Modulation",
-                       label=k,
-                       side=s,
-                       font=self._default_font,
-                       initial_value=MODULATION_DICT['inv'][self.screen_label[s][k].cget('text')],
-                       content=MODULATION_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'step':
-            RadioPopup(widget=self.screen_label[s][k],
-                       pop_label=f"Side {s} Step Size (KHz)",
+                self.cmd_q.put([k, s, f"{int(user_input):03d}"])
+        else:
+            self.msg.queue.put(['ERROR', f"{stamp()}: Side {s} is not "
+                                         "in memory mode. Cannot set memory location."])
+
+    def _on_tone(self, s: str, label: str):
+        k = 'tone'
+        RadioPopup(widget=self.screen_label[s][k],
+                   # title=f"  Side {s} Tone Type  ",
+                   pop_label=f"Side {s} Tone Type",
+                   label=k,
+                   side=s,
+                   font=self._default_font,
+                   initial_value=_TONE_TYPE_INV[label],
+                   content=_TONE_TYPE_INV,
+                   job_q=self.cmd_q)
+
+    def _on_tone_frequency(self, s: str, label: str):
+        k = 'tone_frequency'
+        # We need to know which tone frequencies to present to user
+        tone_type = self.screen_label[s]['tone'].cget('text')
+        # None if no tones are in use
+        content = _TONE_FREQUENCY_CHOICES.get(tone_type)
+        if content is not None:
+            ComboPopup(widget=self.screen_label[s][k],
+                       # title=f"  Side {s} Tone (Hz)  ",
+                       pop_label=f"Side {s} Tone (Hz)",
                        label=k,
                        side=s,
                        font=self._default_font,
-                       initial_value=STEP_DICT['inv'][self.screen_label[s][k].cget('text')],
-                       content=STEP_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'speed':
-            initial_value = DATA_SPEED_DICT['inv'][re.sub("[^0-9]",
-                                                          "",
-                                                          self.speed_button.cget('text'))]
-            RadioPopup(widget=self.speed_button,
-                       # title=f"   Set data audio tap   ",
-                       pop_label=f"Set data audio tap",
-                       label=k,
-                       initial_value=initial_value,
-                       font=self._default_font,
-                       content=DATA_SPEED_DICT['inv'],
+                       content=content,
                        job_q=self.cmd_q)
-        elif k == 'timeout':
-            current_timeout = re.sub("[^0-9]", "", self.timeout_button.cget('text'))
-            RadioPopup(widget=self.timeout_button,
-                       # title=f"  TX Timeout (minutes)  ",
-                       pop_label=f"TX Timeout (minutes)",
-                       label=k,
-                       font=self._default_font,
-                       initial_value=TIMEOUT_DICT['inv'][current_timeout],
-                       content=TIMEOUT_DICT['inv'],
-                       job_q=self.cmd_q)
-        elif k == 'data':
-            if s == 'A':
-                self.cmd_q.put([k, '1'])
-            else:
-                self.cmd_q.put([k, '0'])
+
+    def _on_shift(self, s: str, label: str):
+        k = 'shift'
+        RadioPopup(widget=self.screen_label[s][k],
+                   # title=f"    Side {s} Shift     ",
+                   pop_label=f"Side {s} Shift",
+                   label=k,
+                   side=s,
+                   font=self._default_font,
+                   initial_value=_SHIFT_INV[label],
+                   content=_SHIFT_INV,
+                   job_q=self.cmd_q)
+
+    def _on_mode(self, s: str, label: str):
+        k = 'mode'
+        RadioPopup(widget=self.screen_label[s][k],
+                   # title=f"    Side {s} Mode     ",
+                   pop_label=f"Side {s} Mode",
+                   label=k,
+                   side=s,
+                   font=self._default_font,
+                   initial_value=_MODE_INV[label],
+                   content=_MODE_INV,
+                   job_q=self.cmd_q)
+
+    def _on_power(self, s: str, label: str):
+        k = 'power'
+        RadioPopup(widget=self.screen_label[s][k],
+                   # title=f"   Side {s} TX Power  ",
+                   pop_label=f"Side {s} TX Power",
+                   label=k,
+                   side=s,
+                   font=self._default_font,
+                   initial_value=_POWER_INV[label],
+                   content=_POWER_INV,
+                   job_q=self.cmd_q)
+
+    def _on_modulation(self, s: str, label: str):
+        k = 'modulation'
+        RadioPopup(widget=self.screen_label[s][k],
+                   # title=f"  Side {s} Modulation  ",
+                   pop_label=f"Side {s} Modulation",
+                   label=k,
+                   side=s,
+                   font=self._default_font,
+                   initial_value=_MODULATION_INV[label],
+                   content=_MODULATION_INV,
+                   job_q=self.cmd_q)
+
+    def _on_step(self, s: str, label: str):
+        k = 'step'
+        RadioPopup(widget=self.screen_label[s][k],
+                   pop_label=f"Side {s} Step Size (KHz)",
+                   label=k,
+                   side=s,
+                   font=self._default_font,
+                   initial_value=_STEP_INV[label],
+                   content=_STEP_INV,
+                   job_q=self.cmd_q)
+
+    def _on_speed(self, s: str, label: str):
+        k = 'speed'
+        initial_value = _DATA_SPEED_INV[re.sub("[^0-9]",
+                                               "",
+                                               self.speed_button.cget('text'))]
+        RadioPopup(widget=self.speed_button,
+                   # title=f"   Set data audio tap   ",
+                   pop_label=f"Set data audio tap",
+                   label=k,
+                   initial_value=initial_value,
+                   font=self._default_font,
+                   content=_DATA_SPEED_INV,
+                   job_q=self.cmd_q)
+
+    def _on_timeout(self, s: str, label: str):
+        k = 'timeout'
+        current_timeout = re.sub("[^0-9]", "", self.timeout_button.cget('text'))
+        RadioPopup(widget=self.timeout_button,
+                   # title=f"  TX Timeout (minutes)  ",
+                   pop_label=f"TX Timeout (minutes)",
+                   label=k,
+                   font=self._default_font,
+                   initial_value=_TIMEOUT_INV[current_timeout],
+                   content=_TIMEOUT_INV,
+                   job_q=self.cmd_q)
+
+    def _on_data(self, s: str, label: str):
+        k = 'data'
+        if s == 'A':
+            self.cmd_q.put([k, '1'])
         else:
-            pass
+            self.cmd_q.put([k, '0'])
 
     def change_bg(self, **kwargs):
         """
         Toggle radio's background color and update onscreen display
-        to match
+        to match. Does nothing if the display already has that color.
         :param kwargs: 'color': green or amber
         """
         if 'color' in kwargs.keys():
-            if kwargs['color'] == 'amber':
-                Display._screen_bg_color = self._amber
-            else:
-                Display._screen_bg_color = self._green
+            new_color = Display._bg_colors.get(kwargs['color'], self._green)
         else:  # No color specified - just make it the other color
             if Display._screen_bg_color == self._green:
-                Display._screen_bg_color = self._amber
+                new_color = self._amber
             else:
-                Display._screen_bg_color = self._green
+                new_color = self._green
+        if new_color == Display._screen_bg_color:
+            return
+        Display._screen_bg_color = new_color
         self.screen_frame. \
-            config(background=Display._screen_bg_color)
+            config(background=new_color)
         self.side_separator_frame. \
-            config(background=Display._screen_bg_color)
+            config(background=new_color)
         for side in ('A', 'B'):
             for key in self.labels_dict.keys():
                 self.screen_label[side][key]. \
-                    config(background=Display._screen_bg_color)
+                    config(background=new_color)
 
     def update_display(self, data: dict):
         """
@@ -656,10 +721,10 @@ class Display(object):
         try:
             for s in ('A', 'B'):
                 for key in data[s]:
+                    # Labels were packed when the screen was built, so
+                    # only their text needs changing here
                     self.screen_label[s][key]. \
                         config(text=data[s][key])
-                    self.screen_label[s][key]. \
-                        pack(fill=tk.BOTH, expand=True)
                     self.screen_label[s][key].update()
             if self.current_color != data['backlight']:
                 # Update state to current background color
@@ -684,16 +749,20 @@ class MessageConsole(object):
     Object to create a scrolling console pane in the onscreen display
     to which messages are printed.
     """
+    _POLL_MIN_MS = 50
+    _POLL_MAX_MS = 500
+
     def __init__(self, **kwargs):
         self.frame = kwargs['frame']
         scale = kwargs['scale']
-        _msg_console_font = ("TkFixedFont", scale['message_font_size'])
+        self._msg_console_font = tkfont.nametofont('TkFixedFont').copy()
+        self._msg_console_font.configure(size=scale['message_font_size'])
         self.msg_text = scrolledtext.ScrolledText(master=self.frame,
                                                   state='disabled',
                                                   wrap=tk.WORD,
                                                   width=scale['console_w'],
                                                   height=scale['console_h'],
-                                                  font=_msg_console_font)
+                                                  font=self._msg_console_font)
         self.msg_text.grid(row=0, column=0, columnspan=14, rowspan=5, pady=0)
         self.msg_text.tag_configure('INFO', foreground='blue')
         self.msg_text.tag_configure('WARNING', foreground='black',
@@ -701,16 +770,29 @@ class MessageConsole(object):
         self.msg_text.tag_configure('ERROR', foreground='white',
                                     background='red')
         self.queue = kwargs['queue']
-        self.frame.after(100, self.msg_q_reader)
+        # Message queue polling interval (ms). Backs off while the queue
+        # is idle and snaps back when messages arrive.
+        self._poll_ms = 100
+        self.frame.after(self._poll_ms, self.msg_q_reader)
 
-    def display_message(self, msg):
+    def display_message(self, msg: list):
         """
-        Print messages to the console pane
-        :param msg: String containing text to print
+        Print a message to the console pane
+        :param msg: List containing the level ('INFO', 'WARNING' or
+        'ERROR') and the text to print
+        """
+        self.display_messages([msg])
+
+    def display_messages(self, messages: list):
+        """
+        Print a batch of messages to the console pane. The pane is
+        unlocked, scrolled and locked again once per batch rather
+        than once per message.
+        :param messages: List of [level, text] messages to print
         """
-        _level, _m = msg
         self.msg_text.configure(state='normal')
-        self.msg_text.insert(tk.END, _m + '\n', _level)
+        for _level, _m in messages:
+            self.msg_text.insert(tk.END, _m + '\n', _level)
         self.msg_text.configure(state='disabled')
         # Autoscroll to the bottom
         self.msg_text.yview(tk.END)
@@ -719,11 +801,20 @@ class MessageConsole(object):
         """
         Manage message queue
         """
-        while not self.queue.empty():
-            message = self.queue.get(block=False)
-            self.display_message(message)
+        messages = []
+        while True:
+            try:
+                messages.append(self.queue.get_nowait())
+            except Empty:
+                break
             self.queue.task_done()
-        self.frame.after(100, self.msg_q_reader)
+        if messages:
+            self.display_messages(messages)
+            self._poll_ms = MessageConsole._POLL_MIN_MS
+        else:
+            self._poll_ms = min(self._poll_ms * 2,
+                                MessageConsole._POLL_MAX_MS)
+        self.frame.after(self._poll_ms, self.msg_q_reader)
 
 
 class Popup(object):
@@ -782,15 +873,22 @@ class RadioPopup(Popup):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Keep the popup hidden while it is populated so the geometry
+        # manager lays it out once rather than after every button
+        self.pop.withdraw()
+        # Themed buttons share one style instead of carrying per-widget
+        # options. 'Toolbutton' gives the indicator-less look.
+        ttk.Style(self.pop).configure('popup.Toolbutton', font=self.font)
         for descr, index in self.content.items():
-            tk.Radiobutton(self.pop,
-                           text=descr, variable=self.selected,
-                           value=index, indicatoron=False,
-                           font=self.font,
-                           width=self.width,
-                           command=lambda:
-                           self.selection(self.selected.get())). \
+            ttk.Radiobutton(self.pop,
+                            text=descr, variable=self.selected,
+                            value=index, style='popup.Toolbutton',
+                            width=self.width,
+                            command=lambda:
+                            self.selection(self.selected.get())). \
                 pack(anchor='w', padx=5)
+        self.pop.update_idletasks()
+        self.pop.deiconify()
 
 
 class ToolTip(object):
@@ -798,14 +896,32 @@ class ToolTip(object):
     Implements tool tips on onscreen display
     """
 
+    # Bind tag shared by every widget that has a tool tip. The <Enter>
+    # and <Leave> handlers are bound to the tag once rather than to
+    # each widget.
+    _tag = 'ToolTip'
+    _tag_bound = False
+
     def __init__(self, widget, text, x_offset, y_offset):
         self.widget = widget
         self.text = text
         self.x = x_offset
         self.y = y_offset
         self.tooltipwindow = None
-        widget.bind('<Enter>', lambda _: self.show_tool_tip())
-        widget.bind('<Leave>', lambda _: self.hide_tool_tip())
+        widget.tooltip = self
+        widget.bindtags((ToolTip._tag,) + widget.bindtags())
+        if not ToolTip._tag_bound:
+            widget.bind_class(ToolTip._tag, '<Enter>', ToolTip._on_enter)
+            widget.bind_class(ToolTip._tag, '<Leave>', ToolTip._on_leave)
+            ToolTip._tag_bound = True
+
+    @staticmethod
+    def _on_enter(event):
+        event.widget.tooltip.show_tool_tip()
+
+    @staticmethod
+    def _on_leave(event):
+        event.widget.tooltip.hide_tool_tip()
 
     def show_tool_tip(self):
         self.tooltipwindow = tw = tk.Toplevel(self.widget)
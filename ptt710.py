@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from common710 import stamp
 from queue import Queue
 from common710 import VENDOR_ID, PRODUCT_IDS, NEXUS_PTT_GPIO_DICT
@@ -12,6 +13,50 @@ __maintainer__ = "Steve Magnuson"
 __email__ = "ag7gn@arrl.net"
 __status__ = "Production"
 
+_GPIO_PTT_RE = re.compile("^(left|right|[1-9])")
+
+
+@lru_cache(maxsize=None)
+def _parse_cm108(cm1xx: str) -> tuple:
+    """
+    Parses a cm108[@<index>][:<gpio>] PTT method string
+    :param cm1xx: PTT method string
+    :return: Tuple (GPIO pin, device index). GPIO pin defaults to 3, the
+             most common for PTT on CM1xx, and device index defaults to
+             0, meaning the first device found.
+    """
+    # Check for GPIO pin parameter
+    cm108 = cm1xx.split(':')
+    try:
+        # User specified a GPIO pin
+        cm108_gpio = int(cm108[1])
+    except (ValueError, IndexError):
+        # No GPIO pin specified. Use 3, the most common
+        # for PTT on CM1xx
+        cm108_gpio = 3
+
+    # Check for CMedia device selection
+    cm108 = cm108[0].split('@')
+    try:
+        device_index = int(cm108[1])
+    except (ValueError, IndexError):
+        # User did not specify a particular CM108 device
+        device_index = 0
+    return cm108_gpio, device_index
+
+
+@lru_cache(maxsize=1)
+def _cm108_devices() -> tuple:
+    """
+    Enumerates the USB HID bus once for C-Media devices with GPIO
+    :return: Tuple of HID paths of the CM1xx devices found, in
+             enumeration order
+    """
+    import hid
+    return tuple(device_dict['path']
+                 for device_dict in hid.enumerate(vendor_id=VENDOR_ID)
+                 if device_dict['product_id'] in PRODUCT_IDS)
+
 
 class Ptt(object):
     class CatPtt(object):
@@ -110,23 +155,7 @@ class Ptt(object):
                 self.cm108_ready = False
                 return
 
-            # Check for GPIO pin parameter
-            cm108 = cm1xx.split(':')
-            try:
-                # User specified a GPIO pin
-                cm108_gpio = int(cm108[1])
-            except (ValueError, IndexError):
-                # No GPIO pin specified. Use 3, the most common
-                # for PTT on CM1xx
-                cm108_gpio = 3
-
-            # Check for CMedia device selection
-            cm108 = cm108[0].split('@')
-            try:
-                device_index = int(cm108[1])
-            except (ValueError, IndexError):
-                # User did not specify a particular CM108 device
-                device_index = 0
+            cm108_gpio, device_index = _parse_cm108(cm1xx)
 
             self.ptt_active = 0
             # CM108 info: https://github.com/nwdigitalradio/direwolf/blob/master/cm108.c)
@@ -134,21 +163,19 @@ class Ptt(object):
             self.PTT_on = bytearray([0, 0, mask, mask, 0])
             self.PTT_off = bytearray([0, 0, mask, 0, 0])
             self.path = None
-            index = 0
-            for device_dict in hid.enumerate(vendor_id=VENDOR_ID):
-                if device_dict['product_id'] in PRODUCT_IDS:
-                    if device_index == 0:
-                        # No CM1xx device requested so use the first one found.
-                        # (There is no way to identify individual CM1xx
-                        # USB sound cards because there is no serial number.)
-                        self.path = device_dict['path']
-                        break
-                    else:
-                        # Specific CM1xx device requested
-                        index += 1
-                        self.path = device_dict['path']
-                        if device_index == index:
-                            break
+            devices = _cm108_devices()
+            if devices:
+                if device_index == 0:
+                    # No CM1xx device requested so use the first one found.
+                    # (There is no way to identify individual CM1xx
+                    # USB sound cards because there is no serial number.)
+                    self.path = devices[0]
+                elif 1 <= device_index <= len(devices):
+                    # Specific CM1xx device requested
+                    self.path = devices[device_index - 1]
+                else:
+                    # Requested device not found, so use the last one
+                    self.path = devices[-1]
 
             if self.path is None:
                 self.msg_queue.put(['ERROR', f"{stamp()}: No C-Media device with "
@@ -236,17 +263,21 @@ class Ptt(object):
                 except BadPinFactory:
                     self.gpio_ready = False
                 else:
+                    # PTT is active high, so drive the pin directly
+                    # rather than through the OutputDevice value
+                    # properties on every key up/down
+                    self._pin = self.gpio_ptt.pin
                     self.gpio_ready = True
 
         def on(self):
-            self.gpio_ptt.on()
+            self._pin.state = 1
 
         def off(self):
-            self.gpio_ptt.off()
+            self._pin.state = 0
 
         @property
         def value(self) -> int:
-            return self.gpio_ptt.value
+            return int(self._pin.state)
 
         @property
         def ready(self) -> bool:
@@ -286,7 +317,7 @@ class Ptt(object):
             else:
                 self.msg_queue.put(['INFO', f"{stamp()}: XML-RPC PTT will "
                                             f"be handled via {self.ptt_method} GPIO"])
-        elif re.match("^(left|right|[1-9])", str(self.ptt_method)):
+        elif _GPIO_PTT_RE.match(str(self.ptt_method)):
             self.ptt = self.GPIOPtt(self.ptt_method,
                                     msg_queue=self.msg_queue)
             if not self.ptt.ready:
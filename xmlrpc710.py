@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import Future
 from socketserver import ThreadingMixIn
 from xmlrpc.server import SimpleXMLRPCServer
 from xmlrpc.server import SimpleXMLRPCRequestHandler
@@ -17,6 +18,8 @@ __maintainer__ = "Steve Magnuson"
 __email__ = "ag7gn@arrl.net"
 __status__ = "Production"
 _STATES = ('CLOSE_WAIT', 'ESTABLISHED')
+# Seconds rig.command waits for the controller to run a command
+_COMMAND_TIMEOUT = 5
 
 
 class SimpleThreadedXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
@@ -193,11 +196,14 @@ class RigXMLRPC(object):
             :param cmd: string containing CAT command
             :return:
             """
-            self.cmd_queue.put(['command', cmd])
-            while self.rig.reply_queue.empty():
-                pass
-            answer = self.rig.reply_queue.get()
-            self.rig.reply_queue.task_done()
+            reply = Future()
+            self.cmd_queue.put(['command', cmd, reply])
+            # Wait for the controller to run this command
+            try:
+                answer = reply.result(timeout=_COMMAND_TIMEOUT)
+            except Exception as _:
+                # Command failed, or the controller is no longer running
+                return 'N'
             answer_len = len(answer)
             if answer_len == 1:
                 return str(answer[0])